@@ -13,27 +13,72 @@ Features:
 from __future__ import annotations
 
 import base64
+import bisect
+import concurrent.futures
 import datetime as dt
+import functools
 import hashlib
+import heapq
+import itertools
 import json
+import multiprocessing
 import os
 import platform
+import re
+import sys
+import time
 import tkinter as tk
 import uuid
+from collections import OrderedDict
 from io import BytesIO
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from tkinter import messagebox, simpledialog, ttk
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageTk
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 SUPABASE_URL = "https://gaehvakpfvcuzurbqkvv.supabase.co"
 SUPABASE_PUBLISHABLE_KEY = "sb_publishable_lwqNwhtsIC73MVWFqL35XA_w72wCi1X"
 TABLE_CANDIDATES = ("nag", "events")
 VIEW_ONLY_MODE = True
 AUTO_RELOAD_INTERVAL_MS = 60 * 60 * 1000
+# Every Nth auto-reload rebuilds from the full history instead of rows after the created_at cursor.
+FULL_RELOAD_EVERY_AUTO_RELOADS = 6
+RELOAD_POLL_INTERVAL_MS = 50
+PROCESS_REBUILD_MIN_ROWS = 2000
+# Seconds to wait on the rebuild child before parsing in-process instead.
+PROCESS_REBUILD_TIMEOUT_S = 60
+ROW_IMAGE_CACHE_SIZE = 256
+ROW_IMAGE_FAILURE_LIMIT = 1024
+INSERT_BATCH_SIZE = 500
+# (connect, read) seconds: a dead image host fails fast instead of stalling for the full read timeout.
+IMAGE_FETCH_TIMEOUT = (3, 10)
+ROW_HEIGHT_PX = 64
+ROW_OVERSCAN_PX = 200
+ROW_TOP_PX = 6
+CANVAS_SCROLL_BINDTAG = "NagCanvasScroll"
+CANVAS_ROW_TAG = "row"
+CANVAS_EMPTY_TAG = "empty"
+ROW_TITLE_FONT = ("TkDefaultFont", 10, "bold")
+ROW_SUBTITLE_FONT = ("TkDefaultFont", 8)
+ROW_RIGHT_FONT = ("TkDefaultFont", 9)
 CREDENTIALS_FILE = os.path.join(os.path.expanduser("~"), ".nagme_desktop_credentials.json")
+# Downloaded row images, stored as ready-to-use thumbnails so a restart needs no network for them.
+ICON_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nagme", "icons")
+ICON_CACHE_MAX_AGE_S = 7 * 24 * 60 * 60
+ICON_CACHE_MAX_BYTES = 50 * 1024 * 1024
+ROW_ICON_SIZE = (36, 36)
 CORE_EVENT_SELECT_COLUMNS = "id,created_at,payload,user_id"
 EXTENDED_EVENT_SELECT_COLUMNS = "id,created_at,payload,user_id,icon_png_base64,payload_version,client_synced_at,event_id"
 
@@ -42,9 +87,13 @@ PROJECT_BUCKET = "Project"
 DEFAULT_PROJECT_NAME = "General"
 DEFAULT_BUCKETS = ["Work", "Personal", "Weekend", "Holiday", PROJECT_BUCKET]
 
+MINUTE_MS = 60 * 1000
+DAY_MS = 24 * 60 * 60 * 1000
+
 MONTHLY_VIEW_30_DAYS = 30
 MONTHLY_VIEW_1_YEAR_DAYS = 365
 PRE_DUE_COLOR_WINDOW_DAYS = 14
+PRE_DUE_COLOR_WINDOW_MS = PRE_DUE_COLOR_WINDOW_DAYS * DAY_MS
 
 SORT_ENTERED = "Entered"
 SORT_WEIGHT = "Weight"
@@ -73,6 +122,8 @@ PATTERN_OPTIONS = [
     PATTERN_ANNUAL,
 ]
 
+_PATTERN_SET = frozenset(PATTERN_OPTIONS)
+
 JAVA_MONDAY = 2
 WEEKDAY_OPTIONS = [1, 2, 3, 4, 5, 6, 7]
 NTH_WEEK_OPTIONS = [1, 2, 3, 4, 5]
@@ -86,6 +137,19 @@ COLOR_THEME = {
     "far_future_progress": "#D5D5D5",
 }
 
+BASE64_TEXT_RE = re.compile(r"[A-Za-z0-9+/]+=*")
+WHOLE_NUMBER_RE = re.compile(r"[+-]?\d+")
+# Amount and optional unit of a push duration such as "7d", "1.5 h" or "90" (days).
+DURATION_RE = re.compile(r"([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)\s*(ms|s|m|h|d|w|y)?")
+DURATION_UNIT_MS = {
+    "ms": 1,
+    "s": 1000,
+    "m": 60 * 1000,
+    "h": 60 * 60 * 1000,
+    "d": 24 * 60 * 60 * 1000,
+    "w": 7 * 24 * 60 * 60 * 1000,
+    "y": 365 * 24 * 60 * 60 * 1000,
+}
 INVALID_ICON_TOKENS = {"", "none", "null", "non", "img", "undefined", "nan", "na", "n/a"}
 SORT_ICON_MAP = {
     SORT_ENTERED: "🕒",
@@ -101,16 +165,87 @@ RECURRING_ICON_MAP = {
     RECUR_NEXT_ONLY: "➡️",
     RECUR_ALL_WINDOW: "🔁",
 }
+# Keyed by the stripped, lowercased bucket name.
+BUCKET_ICON_MAP = {
+    ALL_BUCKET.lower(): "🧺",
+    "work": "💼",
+    "personal": "👤",
+    "weekend": "🌴",
+    "holiday": "🎉",
+    PROJECT_BUCKET.lower(): "🗂️",
+}
 
 
 def now_ms() -> int:
     return int(dt.datetime.now(tz=dt.timezone.utc).timestamp() * 1000)
 
 
-def local_tz() -> dt.tzinfo:
+def detect_local_tz() -> dt.tzinfo:
     return dt.datetime.now().astimezone().tzinfo or dt.timezone.utc
 
 
+_LOCAL_TZ = detect_local_tz()
+
+# Network fetches and payload parsing run here so the Tk loop stays responsive.
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="nagme")
+# Row image downloads get their own pool so a cold cache fetches in parallel without
+# queueing behind a reload.
+_IMAGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=6, thread_name_prefix="nagme-image")
+
+
+def build_http_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 8,
+    retries: int = 2,
+    status_forcelist: Tuple[int, ...] = (),
+) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        # raise_on_status=False hands back the last error response so callers can report its body.
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.3,
+            status_forcelist=status_forcelist,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Keep-alive pool for image downloads; Supabase calls use the SupabaseSession's own pool.
+# Images come from many hosts, so more per-host pools are kept than for Supabase.
+_SESSION = build_http_session(pool_connections=8, pool_maxsize=16)
+
+# Table detection results shared by every SupabaseSession in the process, keyed by project URL,
+# so signing out and back in does not re-probe tables already known to be missing or usable.
+_KNOWN_MISSING_TABLES: Set[Tuple[str, str]] = set()
+_KNOWN_GOOD_TABLE: Dict[str, str] = {}
+
+
+def forget_table_detection(supabase_url: str) -> None:
+    _KNOWN_GOOD_TABLE.pop(supabase_url, None)
+    for key in [key for key in _KNOWN_MISSING_TABLES if key[0] == supabase_url]:
+        _KNOWN_MISSING_TABLES.discard(key)
+
+
+def local_tz() -> dt.tzinfo:
+    return _LOCAL_TZ
+
+
+def refresh_local_tz() -> bool:
+    # Re-read the system offset (DST switch, travel); returns True when it changed.
+    global _LOCAL_TZ
+    current = detect_local_tz()
+    if current == _LOCAL_TZ:
+        return False
+    _LOCAL_TZ = current
+    return True
+
+
 def ms_to_local(ms: int) -> dt.datetime:
     return dt.datetime.fromtimestamp(ms / 1000, tz=dt.timezone.utc).astimezone(local_tz())
 
@@ -218,13 +353,97 @@ def normalize_icon_png_base64(raw_value: Any) -> Optional[str]:
     text = "".join(text.split())
     if len(text) < 16:
         return None
-    try:
-        base64.b64decode(text, validate=True)
-    except Exception:
+    # Same acceptance as b64decode(validate=True) without decoding the payload.
+    if BASE64_TEXT_RE.fullmatch(text) is None:
+        return None
+    data_length = len(text.rstrip("="))
+    remainder = data_length % 4
+    padding = len(text) - data_length
+    if remainder == 1 or (remainder == 2 and padding != 2) or (remainder == 3 and padding != 1):
         return None
     return text
 
 
+@functools.lru_cache(maxsize=256)
+def decode_icon_thumbnail(icon_png_base64: str) -> Image.Image:
+    return row_thumbnail(Image.open(BytesIO(base64.b64decode(icon_png_base64))))
+
+
+def row_thumbnail(image: Image.Image) -> Image.Image:
+    # Shrink before the RGBA conversion so a large source is converted at icon size. Palette and
+    # bilevel images convert first, since Pillow only resizes those with nearest-neighbour.
+    # Bilinear is indistinguishable from Lanczos at 36px and cheaper.
+    if image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA")
+    image.thumbnail(ROW_ICON_SIZE, Image.Resampling.BILINEAR)
+    return image.convert("RGBA")
+
+
+def fetch_image_thumbnail(url: str) -> Image.Image:
+    # Worker-side half of a row image: download and shrink. PhotoImage creation stays on the Tk thread.
+    cache_path = os.path.join(ICON_CACHE_DIR, f"{hashlib.blake2b(url.encode('utf-8'), digest_size=10).hexdigest()}.png")
+    try:
+        # mtime is when the file was downloaded (freshness); atime is set on every hit for the
+        # LRU trim, explicitly since relatime/noatime mounts would not update it on read.
+        now = time.time()
+        written = os.path.getmtime(cache_path)
+        if now - written < ICON_CACHE_MAX_AGE_S:
+            with Image.open(cache_path) as cached:
+                image = cached.convert("RGBA")
+            os.utime(cache_path, (now, written))
+            return image
+    except Exception:
+        pass  # Missing, stale or unreadable: fall through to the network.
+
+    response = _SESSION.get(url, timeout=IMAGE_FETCH_TIMEOUT)
+    if response.status_code >= 300:
+        raise RuntimeError(f"Image fetch failed ({response.status_code})")
+    image = row_thumbnail(Image.open(BytesIO(response.content)))
+    try:
+        os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        image.save(temp_path, "PNG")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # The cache is an optimisation; a read-only home just means refetching next start.
+    return image
+
+
+def trim_icon_cache() -> None:
+    # Least recently used thumbnails go first once the directory outgrows ICON_CACHE_MAX_BYTES.
+    try:
+        stats = []
+        for entry in os.scandir(ICON_CACHE_DIR):
+            if entry.is_file():
+                stat = entry.stat()
+                stats.append((stat.st_atime, stat.st_size, entry.path))
+    except OSError:
+        return
+    stats.sort(reverse=True)
+    total = 0
+    for _, size, path in stats:
+        total += size
+        if total > ICON_CACHE_MAX_BYTES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def inline_icon(nag: Nag) -> Tuple[Optional[str], Optional[str]]:
+    # Normalised once per icon value and kept on the Nag, so repaints skip re-hashing the base64.
+    # Compared by identity: the ingest path assigns icon_png_base64 after construction.
+    raw = nag.icon_png_base64
+    cached = nag._inline_icon
+    if cached is None or cached[0] is not raw:
+        normalized = normalize_icon_png_base64(raw)
+        key = None
+        if normalized:
+            key = f"inline:{hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()}"
+        cached = nag._inline_icon = (raw, normalized, key)
+    return cached[1], cached[2]
+
+
 def normalize_project_name(raw_value: Any) -> Optional[str]:
     if raw_value is None:
         return None
@@ -236,6 +455,7 @@ def format_local_datetime(ms: int) -> str:
     return ms_to_local(ms).strftime("%Y-%m-%d %H:%M")
 
 
+@functools.lru_cache(maxsize=64)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     value = hex_color.strip().lstrip("#")
     if len(value) != 6:
@@ -243,9 +463,26 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
 
 
+_THEME_RGB: Dict[str, Tuple[int, int, int]] = {key: hex_to_rgb(value) for key, value in COLOR_THEME.items()}
+EMPTY_BASE_RGB = hex_to_rgb("#ffffff")
+EMPTY_PROGRESS_RGB = hex_to_rgb("#ededed")
+
+
+def reload_palette() -> None:
+    # Call after editing COLOR_THEME at runtime so the cached colours follow it.
+    _THEME_RGB.clear()
+    _THEME_RGB.update({key: hex_to_rgb(value) for key, value in COLOR_THEME.items()})
+    _rebuild_color_tables()
+
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_int_to_hex(packed: int) -> str:
+    return f"#{packed:06x}"
+
+
 def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     r, g, b = (max(0, min(255, int(v))) for v in rgb)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return _rgb_int_to_hex((r << 16) | (g << 8) | b)
 
 
 def lerp_color(start: Tuple[int, int, int], end: Tuple[int, int, int], amount: float) -> Tuple[int, int, int]:
@@ -266,6 +503,25 @@ def alpha_over_white(rgb: Tuple[int, int, int], alpha: float) -> Tuple[int, int,
     )
 
 
+def lerp_alpha_over_white(
+    start: Tuple[int, int, int],
+    end: Tuple[int, int, int],
+    amount: float,
+    alpha: float,
+) -> Tuple[int, int, int]:
+    # lerp_color then alpha_over_white in one step, using the precise (1-t)*a + t*b form.
+    t = max(0.0, min(1.0, amount))
+    a = max(0.0, min(1.0, alpha))
+    k = a * (1 - t)
+    m = a * t
+    w = 255 * (1 - a)
+    return (
+        int(round(start[0] * k + end[0] * m + w)),
+        int(round(start[1] * k + end[1] * m + w)),
+        int(round(start[2] * k + end[2] * m + w)),
+    )
+
+
 def java_day_of_week(date_value: dt.date) -> int:
     # Python: Monday=0..Sunday=6, Java Calendar: Sunday=1..Saturday=7
     return ((date_value.weekday() + 1) % 7) + 1
@@ -280,47 +536,44 @@ def month_max_day(year: int, month: int) -> int:
 
 
 def nth_weekday_day_of_month(year: int, month: int, target_java_dow: int, nth_week: int) -> int:
-    max_day = month_max_day(year, month)
-    matches: List[int] = []
-    for day in range(1, max_day + 1):
-        if java_day_of_week(dt.date(year, month, day)) == target_java_dow:
-            matches.append(day)
-    if not matches:
+    if target_java_dow not in WEEKDAY_OPTIONS:
         return 1
+    max_day = month_max_day(year, month)
+    # Weekdays repeat every 7 days, so day 1 fixes every later match.
+    first_match_day = (target_java_dow - java_day_of_week(dt.date(year, month, 1))) % 7 + 1
+    match_count = 1 + (max_day - first_match_day) // 7
     if nth_week >= 5:
-        return matches[-1]
-    index = max(0, nth_week - 1)
-    return matches[index] if index < len(matches) else matches[-1]
+        index = match_count - 1
+    else:
+        index = min(max(0, nth_week - 1), match_count - 1)
+    return first_match_day + 7 * index
+
+
+_DURATION_TABLE = (
+    ("w", 7 * 24 * 60 * 60 * 1000),
+    ("d", 24 * 60 * 60 * 1000),
+    ("h", 60 * 60 * 1000),
+    ("m", 60 * 1000),
+    ("s", 1000),
+)
 
 
 def format_duration_compact(duration_ms: int) -> str:
     millis = max(0, int(duration_ms))
-    week = 7 * 24 * 60 * 60 * 1000
-    day = 24 * 60 * 60 * 1000
-    hour = 60 * 60 * 1000
-    minute = 60 * 1000
-    second = 1000
-    if millis >= week:
-        return f"{millis // week}w"
-    if millis >= day:
-        return f"{millis // day}d"
-    if millis >= hour:
-        return f"{millis // hour}h"
-    if millis >= minute:
-        return f"{millis // minute}m"
-    if millis >= second:
-        return f"{millis // second}s"
+    for suffix, unit_ms in _DURATION_TABLE:
+        if millis >= unit_ms:
+            return f"{millis // unit_ms}{suffix}"
     return f"{millis}ms"
 
 
-@dataclass
+@dataclass(slots=True)
 class DueWindow:
     start_ms: int
     due_ms: int
     source_due_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class NagLineVisual:
     base_color: Tuple[int, int, int]
     progress_color: Tuple[int, int, int]
@@ -330,7 +583,7 @@ class NagLineVisual:
     percent_label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Nag:
     work_name: str
     nag_text: str
@@ -360,6 +613,20 @@ class Nag:
     pushed_offset_ms: int = 0
     push_count: int = 0
     pushed_total_ms: int = 0
+    _skipped_set: FrozenSet[int] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _created_local_month: int = field(default=1, init=False, repr=False, compare=False)
+    # (icon_png_base64 it was computed for, normalised base64, image cache key); see inline_icon().
+    _inline_icon: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._skipped_set = frozenset(self.skipped_monthly_due_epoch_ms)
+        try:
+            self._created_local_month = ms_to_local(self.created_at_epoch_ms).month
+        except (OverflowError, OSError, ValueError):
+            # Out of datetime's range; only a quarterly rule without an anchor month reads this.
+            self._created_local_month = 1
 
     @staticmethod
     def from_payload(payload: Dict[str, Any]) -> Optional["Nag"]:
@@ -378,11 +645,15 @@ class Nag:
                 return int(raw)
 
             skipped_raw = payload.get("skippedMonthlyDueEpochMillis", [])
-            skipped: List[int] = []
+            skipped: set[int] = set()
             if isinstance(skipped_raw, list):
                 for item in skipped_raw:
+                    # Stored values are plain ints; only other types pay for int() and the try.
+                    if type(item) is int:
+                        skipped.add(item)
+                        continue
                     try:
-                        skipped.append(int(item))
+                        skipped.add(int(item))
                     except Exception:
                         continue
 
@@ -412,11 +683,15 @@ class Nag:
             recurring_visible_days_before_due = opt_int("recurringVisibleDaysBeforeDue")
             if recurring_visible_days_before_due is not None:
                 recurring_visible_days_before_due = max(1, recurring_visible_days_before_due)
-            bucket = str(payload.get("bucket", DEFAULT_BUCKETS[0])) or DEFAULT_BUCKETS[0]
+            bucket = sys.intern(str(payload.get("bucket", DEFAULT_BUCKETS[0])) or DEFAULT_BUCKETS[0])
             if bucket.lower() == PROJECT_BUCKET.lower():
                 project_name = project_name or DEFAULT_PROJECT_NAME
             else:
                 project_name = None
+            # Unknown patterns fall back to day-of-month, same as the edit dialog.
+            recurring_pattern_type = str(payload.get("recurringPatternType", PATTERN_DAY_OF_MONTH)).strip().upper()
+            if recurring_pattern_type not in _PATTERN_SET:
+                recurring_pattern_type = PATTERN_DAY_OF_MONTH
 
             return Nag(
                 work_name=work_name,
@@ -424,7 +699,7 @@ class Nag:
                 bucket=bucket,
                 project_name=project_name,
                 lateness_days=max(1, int(payload.get("latenessDays", 7))),
-                mode=str(payload.get("mode", NAG_MODE_ONE_TIME)) or NAG_MODE_ONE_TIME,
+                mode=sys.intern(str(payload.get("mode", NAG_MODE_ONE_TIME)) or NAG_MODE_ONE_TIME),
                 repeat_minutes=max(1, int(payload.get("repeatMinutes", 60))),
                 continue_minutes=continue_minutes,
                 notifications_enabled=bool(payload.get("notificationsEnabled", True)),
@@ -434,11 +709,11 @@ class Nag:
                 monthly_hour=opt_int("monthlyHour"),
                 monthly_minute=opt_int("monthlyMinute"),
                 created_at_epoch_ms=int(payload.get("createdAtEpochMillis", now_ms())),
-                skipped_monthly_due_epoch_ms=sorted(set(skipped)),
+                skipped_monthly_due_epoch_ms=sorted(skipped),
                 icon_glyph=icon_glyph,
                 icon_png_base64=icon_png_base64,
                 image_url=image_url,
-                recurring_pattern_type=str(payload.get("recurringPatternType", PATTERN_DAY_OF_MONTH)),
+                recurring_pattern_type=sys.intern(recurring_pattern_type),
                 recurring_day_of_week=opt_int("recurringDayOfWeek"),
                 recurring_nth_week=opt_int("recurringNthWeek"),
                 recurring_month_of_year=opt_int("recurringMonthOfYear"),
@@ -486,113 +761,289 @@ class Nag:
         }
 
     def is_monthly_due_skipped(self, due_ms: int) -> bool:
-        return due_ms in set(self.skipped_monthly_due_epoch_ms)
+        return due_ms in self._skipped_set
 
 
-@dataclass
+@dataclass(slots=True)
 class NagListEntry:
     nag: Nag
     due_window: Optional[DueWindow]
     key: str
 
+
+# Per-refresh thresholds shared by the entry builders, the sort and the row visuals.
+@dataclass
+class RefreshContext:
+    now_ms: int
+    pre_due_threshold_ms: int
+    horizon_30_end_ms: int
+    horizon_365_end_ms: int
+
+    @staticmethod
+    def build(now_ms_value: int) -> "RefreshContext":
+        return RefreshContext(
+            now_ms=now_ms_value,
+            pre_due_threshold_ms=now_ms_value + PRE_DUE_COLOR_WINDOW_MS,
+            horizon_30_end_ms=now_ms_value + MONTHLY_VIEW_30_DAYS * DAY_MS,
+            horizon_365_end_ms=now_ms_value + MONTHLY_VIEW_1_YEAR_DAYS * DAY_MS,
+        )
+
+    def horizon_end_ms(self, monthly_view_days: int) -> int:
+        if monthly_view_days >= MONTHLY_VIEW_1_YEAR_DAYS:
+            return self.horizon_365_end_ms
+        return self.horizon_30_end_ms
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    # Hashable snapshot of the Nag fields that decide recurring due dates.
+    mode: str
+    recurring_pattern_type: str
+    monthly_day: Optional[int]
+    monthly_hour: Optional[int]
+    monthly_minute: Optional[int]
+    recurring_day_of_week: Optional[int]
+    recurring_nth_week: Optional[int]
+    recurring_month_of_year: Optional[int]
+    recurring_quarter_anchor_month: Optional[int]
+    created_local_month: int
+    skipped_monthly_due_epoch_ms: FrozenSet[int]
+
+    @staticmethod
+    def from_nag(nag: Nag) -> "RecurrenceRule":
+        return RecurrenceRule(
+            mode=nag.mode,
+            recurring_pattern_type=nag.recurring_pattern_type,
+            monthly_day=nag.monthly_day,
+            monthly_hour=nag.monthly_hour,
+            monthly_minute=nag.monthly_minute,
+            recurring_day_of_week=nag.recurring_day_of_week,
+            recurring_nth_week=nag.recurring_nth_week,
+            recurring_month_of_year=nag.recurring_month_of_year,
+            recurring_quarter_anchor_month=nag.recurring_quarter_anchor_month,
+            created_local_month=nag._created_local_month,
+            skipped_monthly_due_epoch_ms=nag._skipped_set,
+        )
+
+    def is_monthly_due_skipped(self, due_ms: int) -> bool:
+        return due_ms in self.skipped_monthly_due_epoch_ms
+
+
 def apply_push_offset(nag: Nag, base_due_ms: int) -> int:
     return base_due_ms + max(0, nag.pushed_offset_ms)
 
 
-def is_recurring_date_match(nag: Nag, day_value: dt.date) -> bool:
-    if nag.mode != NAG_MODE_MONTHLY:
-        return False
+def recurring_day_of_month_target(rule: RecurrenceRule, max_day: int) -> Optional[int]:
+    # None means every day of an in-cycle month matches (no monthly day set).
+    if not rule.monthly_day:
+        return None
+    return min(rule.monthly_day, max_day)
 
-    year = day_value.year
-    month = day_value.month
-    day_of_month = day_value.day
-    java_dow = java_day_of_week(day_value)
-    max_day = month_max_day(year, month)
-    pattern = nag.recurring_pattern_type or PATTERN_DAY_OF_MONTH
 
-    if pattern == PATTERN_DAY_OF_MONTH:
-        target_day = min(nag.monthly_day or day_of_month, max_day)
-        return day_of_month == target_day
+def _quarter_month_matches(rule: RecurrenceRule, month: int) -> bool:
+    anchor_month = max(1, min(12, rule.recurring_quarter_anchor_month or rule.created_local_month))
+    return (month - anchor_month) % 3 == 0
 
-    if pattern == PATTERN_DAY_OF_WEEK:
-        return java_dow == (nag.recurring_day_of_week or JAVA_MONDAY)
 
-    if pattern == PATTERN_NTH_WEEKDAY:
-        target_day = nth_weekday_day_of_month(
-            year=year,
-            month=month,
-            target_java_dow=(nag.recurring_day_of_week or JAVA_MONDAY),
-            nth_week=(nag.recurring_nth_week or 1),
-        )
-        return day_of_month == target_day
+def _annual_month_matches(rule: RecurrenceRule, month: int) -> bool:
+    return not rule.recurring_month_of_year or month == max(1, min(12, rule.recurring_month_of_year))
 
-    if pattern == PATTERN_END_OF_MONTH:
-        return day_of_month == max_day
 
-    if pattern == PATTERN_QUARTERLY:
-        created_month = ms_to_local(nag.created_at_epoch_ms).month
-        anchor_month = max(1, min(12, nag.recurring_quarter_anchor_month or created_month))
-        month_delta = ((month - anchor_month) % 12 + 12) % 12
-        in_cycle = month_delta % 3 == 0
-        target_day = min(nag.monthly_day or day_of_month, max_day)
-        return in_cycle and day_of_month == target_day
+def _nth_weekday_for_rule(rule: RecurrenceRule, year: int, month: int) -> int:
+    return nth_weekday_day_of_month(
+        year=year,
+        month=month,
+        target_java_dow=(rule.recurring_day_of_week or JAVA_MONDAY),
+        nth_week=(rule.recurring_nth_week or 1),
+    )
 
-    if pattern == PATTERN_ANNUAL:
-        target_month = max(1, min(12, nag.recurring_month_of_year or month))
-        target_day = min(nag.monthly_day or day_of_month, max_day)
-        return month == target_month and day_of_month == target_day
 
-    return False
+def _first_day_of_month(rule: RecurrenceRule, year: int, month: int, min_day: int, max_day: int) -> Optional[int]:
+    target_day = recurring_day_of_month_target(rule, max_day)
+    if target_day is None:
+        return min_day
+    return target_day if target_day >= min_day else None
 
 
-def resolve_next_recurring_base_due_ms(nag: Nag, reference_ms: int) -> Optional[int]:
-    if nag.mode != NAG_MODE_MONTHLY:
+def _first_day_of_week(rule: RecurrenceRule, year: int, month: int, min_day: int, max_day: int) -> Optional[int]:
+    target_dow = rule.recurring_day_of_week or JAVA_MONDAY
+    if target_dow not in WEEKDAY_OPTIONS:
         return None
-    if nag.monthly_hour is None or nag.monthly_minute is None:
+    day = min_day + (target_dow - java_day_of_week(dt.date(year, month, min_day))) % 7
+    return day if day <= max_day else None
+
+
+def _first_nth_weekday(rule: RecurrenceRule, year: int, month: int, min_day: int, max_day: int) -> Optional[int]:
+    day = _nth_weekday_for_rule(rule, year, month)
+    return day if day >= min_day else None
+
+
+def _first_end_of_month(rule: RecurrenceRule, year: int, month: int, min_day: int, max_day: int) -> Optional[int]:
+    return max_day
+
+
+def _first_quarterly(rule: RecurrenceRule, year: int, month: int, min_day: int, max_day: int) -> Optional[int]:
+    if not _quarter_month_matches(rule, month):
+        return None
+    return _first_day_of_month(rule, year, month, min_day, max_day)
+
+
+def _first_annual(rule: RecurrenceRule, year: int, month: int, min_day: int, max_day: int) -> Optional[int]:
+    if not _annual_month_matches(rule, month):
+        return None
+    return _first_day_of_month(rule, year, month, min_day, max_day)
+
+
+def _last_day_of_month(rule: RecurrenceRule, year: int, month: int, limit_day: int, max_day: int) -> Optional[int]:
+    target_day = recurring_day_of_month_target(rule, max_day)
+    if target_day is None:
+        return limit_day
+    return target_day if 1 <= target_day <= limit_day else None
+
+
+def _last_day_of_week(rule: RecurrenceRule, year: int, month: int, limit_day: int, max_day: int) -> Optional[int]:
+    target_dow = rule.recurring_day_of_week or JAVA_MONDAY
+    if target_dow not in WEEKDAY_OPTIONS:
+        return None
+    day = limit_day - (java_day_of_week(dt.date(year, month, limit_day)) - target_dow) % 7
+    return day if day >= 1 else None
+
+
+def _last_nth_weekday(rule: RecurrenceRule, year: int, month: int, limit_day: int, max_day: int) -> Optional[int]:
+    day = _nth_weekday_for_rule(rule, year, month)
+    return day if day <= limit_day else None
+
+
+def _last_end_of_month(rule: RecurrenceRule, year: int, month: int, limit_day: int, max_day: int) -> Optional[int]:
+    return max_day if max_day <= limit_day else None
+
+
+def _last_quarterly(rule: RecurrenceRule, year: int, month: int, limit_day: int, max_day: int) -> Optional[int]:
+    if not _quarter_month_matches(rule, month):
+        return None
+    return _last_day_of_month(rule, year, month, limit_day, max_day)
+
+
+def _last_annual(rule: RecurrenceRule, year: int, month: int, limit_day: int, max_day: int) -> Optional[int]:
+    if not _annual_month_matches(rule, month):
+        return None
+    return _last_day_of_month(rule, year, month, limit_day, max_day)
+
+
+_FIRST_DAY_HANDLERS = {
+    PATTERN_DAY_OF_MONTH: _first_day_of_month,
+    PATTERN_DAY_OF_WEEK: _first_day_of_week,
+    PATTERN_NTH_WEEKDAY: _first_nth_weekday,
+    PATTERN_END_OF_MONTH: _first_end_of_month,
+    PATTERN_QUARTERLY: _first_quarterly,
+    PATTERN_ANNUAL: _first_annual,
+}
+
+_LAST_DAY_HANDLERS = {
+    PATTERN_DAY_OF_MONTH: _last_day_of_month,
+    PATTERN_DAY_OF_WEEK: _last_day_of_week,
+    PATTERN_NTH_WEEKDAY: _last_nth_weekday,
+    PATTERN_END_OF_MONTH: _last_end_of_month,
+    PATTERN_QUARTERLY: _last_quarterly,
+    PATTERN_ANNUAL: _last_annual,
+}
+
+
+def first_recurring_day_in_month(rule: RecurrenceRule, year: int, month: int, min_day: int) -> Optional[int]:
+    max_day = month_max_day(year, month)
+    if min_day > max_day:
+        return None
+    handler = _FIRST_DAY_HANDLERS.get(rule.recurring_pattern_type, _first_day_of_month)
+    return handler(rule, year, month, min_day, max_day)
+
+
+def last_recurring_day_in_month(rule: RecurrenceRule, year: int, month: int, max_allowed_day: int) -> Optional[int]:
+    max_day = month_max_day(year, month)
+    limit_day = min(max_allowed_day, max_day)
+    if limit_day < 1:
         return None
+    handler = _LAST_DAY_HANDLERS.get(rule.recurring_pattern_type, _last_day_of_month)
+    return handler(rule, year, month, limit_day, max_day)
+
+
+def is_recurring_date_match(nag: Nag, day_value: dt.date) -> bool:
+    if nag.mode != NAG_MODE_MONTHLY:
+        return False
+    rule = RecurrenceRule.from_nag(nag)
+    return first_recurring_day_in_month(rule, day_value.year, day_value.month, day_value.day) == day_value.day
+
 
-    start = ms_to_local(reference_ms)
-    probe_date = start.date()
-    for day_offset in range(0, 366 * 6 + 1):
-        current_date = probe_date + dt.timedelta(days=day_offset)
-        if not is_recurring_date_match(nag, current_date):
+def iter_recurring_dates_forward(rule: RecurrenceRule, start_date: dt.date, end_date: dt.date) -> Iterator[dt.date]:
+    year, month, min_day = start_date.year, start_date.month, start_date.day
+    while (year, month) <= (end_date.year, end_date.month):
+        day = first_recurring_day_in_month(rule, year, month, min_day)
+        if day is None:
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            min_day = 1
             continue
+        current_date = dt.date(year, month, day)
+        if current_date > end_date:
+            return
+        yield current_date
+        min_day = day + 1
+
+
+def iter_recurring_dates_backward(rule: RecurrenceRule, start_date: dt.date, end_date: dt.date) -> Iterator[dt.date]:
+    year, month, max_allowed_day = start_date.year, start_date.month, start_date.day
+    while (year, month) >= (end_date.year, end_date.month):
+        day = last_recurring_day_in_month(rule, year, month, max_allowed_day)
+        if day is None:
+            year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+            max_allowed_day = 31
+            continue
+        current_date = dt.date(year, month, day)
+        if current_date < end_date:
+            return
+        yield current_date
+        max_allowed_day = day - 1
+
+
+def clear_recurrence_cache() -> None:
+    _next_base_due_cached.cache_clear()
+    _previous_base_due_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _next_base_due_cached(rule: RecurrenceRule, reference_ms: int) -> Optional[int]:
+    probe_date = ms_to_local(reference_ms).date()
+    horizon_date = probe_date + dt.timedelta(days=366 * 6)
+    tz = local_tz()
+    for current_date in iter_recurring_dates_forward(rule, probe_date, horizon_date):
         due_dt = dt.datetime(
             current_date.year,
             current_date.month,
             current_date.day,
-            nag.monthly_hour,
-            nag.monthly_minute,
-            tzinfo=local_tz(),
+            rule.monthly_hour,
+            rule.monthly_minute,
+            tzinfo=tz,
         )
         due_ms = local_to_ms(due_dt)
         if due_ms < reference_ms:
             continue
-        if nag.is_monthly_due_skipped(due_ms):
+        if rule.is_monthly_due_skipped(due_ms):
             continue
         return due_ms
     return None
 
 
-def resolve_previous_recurring_base_due_ms(nag: Nag, reference_ms: int) -> Optional[int]:
-    if nag.mode != NAG_MODE_MONTHLY:
-        return None
-    if nag.monthly_hour is None or nag.monthly_minute is None:
-        return None
-
-    start = ms_to_local(reference_ms)
-    probe_date = start.date()
-    for day_offset in range(0, 366 * 6 + 1):
-        current_date = probe_date - dt.timedelta(days=day_offset)
-        if not is_recurring_date_match(nag, current_date):
-            continue
+@functools.lru_cache(maxsize=4096)
+def _previous_base_due_cached(rule: RecurrenceRule, reference_ms: int) -> Optional[int]:
+    probe_date = ms_to_local(reference_ms).date()
+    horizon_date = probe_date - dt.timedelta(days=366 * 6)
+    tz = local_tz()
+    for current_date in iter_recurring_dates_backward(rule, probe_date, horizon_date):
         due_dt = dt.datetime(
             current_date.year,
             current_date.month,
             current_date.day,
-            nag.monthly_hour,
-            nag.monthly_minute,
-            tzinfo=local_tz(),
+            rule.monthly_hour,
+            rule.monthly_minute,
+            tzinfo=tz,
         )
         due_ms = local_to_ms(due_dt)
         if due_ms > reference_ms:
@@ -601,6 +1052,26 @@ def resolve_previous_recurring_base_due_ms(nag: Nag, reference_ms: int) -> Optio
     return None
 
 
+def resolve_next_recurring_base_due_ms(nag: Nag, reference_ms: int) -> Optional[int]:
+    if nag.mode != NAG_MODE_MONTHLY:
+        return None
+    if nag.monthly_hour is None or nag.monthly_minute is None:
+        return None
+    # Occurrences land on whole minutes, so rounding the reference up to the
+    # minute keeps the answer exact while calls in one refresh share a slot.
+    reference_minute_ms = -(-reference_ms // MINUTE_MS) * MINUTE_MS
+    return _next_base_due_cached(RecurrenceRule.from_nag(nag), reference_minute_ms)
+
+
+def resolve_previous_recurring_base_due_ms(nag: Nag, reference_ms: int) -> Optional[int]:
+    if nag.mode != NAG_MODE_MONTHLY:
+        return None
+    if nag.monthly_hour is None or nag.monthly_minute is None:
+        return None
+    reference_minute_ms = (reference_ms // MINUTE_MS) * MINUTE_MS
+    return _previous_base_due_cached(RecurrenceRule.from_nag(nag), reference_minute_ms)
+
+
 def resolve_current_display_monthly_due_window(nag: Nag, reference_ms: int) -> Optional[DueWindow]:
     base_due = resolve_next_recurring_base_due_ms(nag, reference_ms)
     if base_due is None:
@@ -613,29 +1084,56 @@ def resolve_current_display_monthly_due_window(nag: Nag, reference_ms: int) -> O
     )
 
 
+def _resolve_display_and_next(nag: Nag, now_ms_value: int) -> Tuple[Optional[DueWindow], Optional[int]]:
+    # The display window is built from the next base due, so its pushed due is the next upcoming due.
+    display_window = resolve_current_display_monthly_due_window(nag, now_ms_value)
+    if display_window is None:
+        return None, None
+    return display_window, display_window.due_ms
+
+
 def resolve_monthly_due_windows_in_range(nag: Nag, range_start_ms: int, range_end_ms: int) -> List[DueWindow]:
     if range_end_ms < range_start_ms:
         return []
+    if nag.mode != NAG_MODE_MONTHLY:
+        return []
+    if nag.monthly_hour is None or nag.monthly_minute is None:
+        return []
+    rule = RecurrenceRule.from_nag(nag)
+    reference_ms = -(-range_start_ms // MINUTE_MS) * MINUTE_MS
+    # Push offsets never move a due earlier, so occurrences past the range end can stop the walk.
+    end_date = ms_to_local(range_end_ms).date() + dt.timedelta(days=1)
+    tz = local_tz()
     windows: List[DueWindow] = []
-    search_cursor = range_start_ms
-    guard = 0
-    while guard < 600:
-        next_base_due = resolve_next_recurring_base_due_ms(nag, search_cursor)
-        if next_base_due is None:
-            break
-        due_ms = apply_push_offset(nag, next_base_due)
-        if due_ms > range_end_ms:
+    # Window starts use the previous raw occurrence, skipped or not; only the first needs a lookup.
+    previous_base_due: Optional[int] = None
+    for current_date in iter_recurring_dates_forward(rule, ms_to_local(reference_ms).date(), end_date):
+        base_due = local_to_ms(
+            dt.datetime(
+                current_date.year,
+                current_date.month,
+                current_date.day,
+                rule.monthly_hour,
+                rule.monthly_minute,
+                tzinfo=tz,
+            )
+        )
+        if base_due < reference_ms or rule.is_monthly_due_skipped(base_due):
+            previous_base_due = base_due
+            continue
+        due_ms = apply_push_offset(nag, base_due)
+        if due_ms > range_end_ms or len(windows) >= 600:
             break
-        previous_base_due = resolve_previous_recurring_base_due_ms(nag, next_base_due - 1) or nag.created_at_epoch_ms
+        if previous_base_due is None:
+            previous_base_due = resolve_previous_recurring_base_due_ms(nag, base_due - 1)
         windows.append(
             DueWindow(
-                start_ms=max(previous_base_due, nag.created_at_epoch_ms),
+                start_ms=max(previous_base_due or nag.created_at_epoch_ms, nag.created_at_epoch_ms),
                 due_ms=due_ms,
-                source_due_ms=next_base_due,
+                source_due_ms=base_due,
             )
         )
-        search_cursor = next_base_due + 60_000
-        guard += 1
+        previous_base_due = base_due
     return windows
 
 
@@ -663,10 +1161,52 @@ def resolve_next_due_ms(nag: Nag, reference_ms: int) -> Optional[int]:
     return apply_push_offset(nag, base_due)
 
 
-def effective_project_name(nag: Nag) -> Optional[str]:
-    if (nag.bucket or "").strip().lower() != PROJECT_BUCKET.lower():
+# Keyed on the two strings it reads; they repeat across nags and filter clicks.
+@functools.lru_cache(maxsize=4096)
+def _effective_project_name(bucket: Optional[str], project_name: Optional[str]) -> Optional[str]:
+    if (bucket or "").strip().lower() != PROJECT_BUCKET.lower():
         return None
-    return normalize_project_name(nag.project_name) or DEFAULT_PROJECT_NAME
+    return normalize_project_name(project_name) or DEFAULT_PROJECT_NAME
+
+
+def effective_project_name(nag: Nag) -> Optional[str]:
+    return _effective_project_name(nag.bucket, nag.project_name)
+
+
+@dataclass(slots=True)
+class NagFilterIndex:
+    # Nags grouped by every filter the bucket bar can select, built once per change to
+    # nags_by_work; a filter click then reads its group instead of scanning all nags.
+    outside_project_bucket: List[Nag]
+    in_project_bucket: List[Nag]
+    by_bucket: Dict[str, List[Nag]]
+    # Project-bucket nags keyed by lowercased project name (DEFAULT_PROJECT_NAME when unnamed).
+    by_project_key: Dict[str, List[Nag]]
+    # Tasks per named project, for the project overview subtitles.
+    project_counts: Dict[str, int]
+
+    @staticmethod
+    def build(nags_by_work: Dict[str, Nag]) -> "NagFilterIndex":
+        project_bucket = PROJECT_BUCKET.lower()
+        index = NagFilterIndex(
+            outside_project_bucket=[],
+            in_project_bucket=[],
+            by_bucket={},
+            by_project_key={},
+            project_counts={},
+        )
+        for nag in nags_by_work.values():
+            index.by_bucket.setdefault(nag.bucket, []).append(nag)
+            project_name = effective_project_name(nag)
+            if project_name:
+                index.project_counts[project_name] = index.project_counts.get(project_name, 0) + 1
+            if (nag.bucket or "").strip().lower() == project_bucket:
+                index.in_project_bucket.append(nag)
+                project_key = (project_name or DEFAULT_PROJECT_NAME).lower()
+                index.by_project_key.setdefault(project_key, []).append(nag)
+            else:
+                index.outside_project_bucket.append(nag)
+        return index
 
 
 def should_show_recurring_due_window(nag: Nag, due_ms: int, now_ms_value: int) -> bool:
@@ -675,7 +1215,7 @@ def should_show_recurring_due_window(nag: Nag, due_ms: int, now_ms_value: int) -
     visible_days = nag.recurring_visible_days_before_due
     if visible_days is None:
         return True
-    threshold_ms = now_ms_value + max(1, int(visible_days)) * 24 * 60 * 60 * 1000
+    threshold_ms = now_ms_value + max(1, int(visible_days)) * DAY_MS
     return due_ms <= threshold_ms
 
 
@@ -684,10 +1224,10 @@ def build_visible_entries(
     now_ms_value: int,
     monthly_view_days: int,
     recurring_view_mode: str,
+    context: Optional[RefreshContext] = None,
 ) -> List[NagListEntry]:
-    horizon_days = MONTHLY_VIEW_1_YEAR_DAYS if monthly_view_days >= MONTHLY_VIEW_1_YEAR_DAYS else MONTHLY_VIEW_30_DAYS
-    horizon_ms = horizon_days * 24 * 60 * 60 * 1000
-    horizon_end_ms = now_ms_value + horizon_ms
+    context = context or RefreshContext.build(now_ms_value)
+    horizon_end_ms = context.horizon_end_ms(monthly_view_days)
 
     entries: List[NagListEntry] = []
     for nag in nags:
@@ -702,11 +1242,10 @@ def build_visible_entries(
                     continue
                 entries.append(NagListEntry(nag=nag, due_window=window, key=f"{nag.work_name}_{window.due_ms}"))
         else:
-            display_window = resolve_current_display_monthly_due_window(nag, now_ms_value)
-            next_upcoming = resolve_next_due_ms(nag, now_ms_value)
+            display_window, next_upcoming = _resolve_display_and_next(nag, now_ms_value)
             if display_window is None or next_upcoming is None:
                 continue
-            if (next_upcoming - now_ms_value) > horizon_ms:
+            if next_upcoming > horizon_end_ms:
                 continue
             if not should_show_recurring_due_window(nag, next_upcoming, now_ms_value):
                 continue
@@ -714,6 +1253,14 @@ def build_visible_entries(
     return entries
 
 
+def _nag_due_info(nag: Nag, now_ms_value: int) -> Tuple[Optional[DueWindow], int]:
+    due_window = resolve_due_window(nag, now_ms_value)
+    if due_window is None:
+        # Both modes derive the window from the same next due, so there is none to fall back to.
+        return None, 2**63 - 1
+    return due_window, due_window.due_ms
+
+
 def build_project_overview_entries(nags: List[Nag], now_ms_value: int) -> List[NagListEntry]:
     if not nags:
         return []
@@ -727,8 +1274,7 @@ def build_project_overview_entries(nags: List[Nag], now_ms_value: int) -> List[N
     for project_name, project_nags in grouped.items():
         representative: Optional[Tuple[Nag, Optional[DueWindow], int]] = None
         for nag in project_nags:
-            due_window = resolve_due_window(nag, now_ms_value)
-            due_ms = due_window.due_ms if due_window is not None else (resolve_next_due_ms(nag, now_ms_value) or 2**63 - 1)
+            due_window, due_ms = _nag_due_info(nag, now_ms_value)
             candidate = (nag, due_window, due_ms)
             if representative is None:
                 representative = candidate
@@ -751,44 +1297,113 @@ def build_project_overview_entries(nags: List[Nag], now_ms_value: int) -> List[N
     return entries
 
 
-def smart_status_rank(due_ms: int, now_ms_value: int) -> int:
+def smart_status_rank(due_ms: int, context: RefreshContext) -> int:
     if due_ms == 2**63 - 1:
         return 3
-    if now_ms_value > due_ms:
+    if context.now_ms > due_ms:
         return 0
-    if (due_ms - now_ms_value) <= PRE_DUE_COLOR_WINDOW_DAYS * 24 * 60 * 60 * 1000:
+    if due_ms <= context.pre_due_threshold_ms:
         return 1
     return 2
 
 
-def sort_entries(entries: List[NagListEntry], sort_mode: str, now_ms_value: int) -> List[NagListEntry]:
+_SORT_FIELD_BIAS = 2**63
+
+
+def sort_entries(
+    entries: List[NagListEntry],
+    sort_mode: str,
+    now_ms_value: int,
+    context: Optional[RefreshContext] = None,
+) -> List[NagListEntry]:
     max_long = 2**63 - 1
+    context = context or RefreshContext.build(now_ms_value)
 
-    def entry_due_ms(entry: NagListEntry) -> int:
+    # Resolve every entry's due once; the sort then compares plain tuples.
+    due_values: List[int] = []
+    for entry in entries:
         if entry.due_window is not None:
-            return entry.due_window.due_ms
+            due_values.append(entry.due_window.due_ms)
+            continue
         due = resolve_next_due_ms(entry.nag, now_ms_value)
-        return due if due is not None else max_long
+        due_values.append(due if due is not None else max_long)
+
+    created_values = [e.nag.created_at_epoch_ms for e in entries]
+    weights = [e.nag.weight for e in entries]
+    if entries and _packable_sort_fields(due_values, created_values, weights):
+        keys = _packed_sort_keys(entries, sort_mode, due_values, created_values, context)
+    else:
+        keys = _tuple_sort_keys(entries, sort_mode, due_values, created_values, context)
+    order = sorted(range(len(entries)), key=keys.__getitem__)
+    return [entries[i] for i in order]
+
+
+def _packable_sort_fields(due_values: List[int], created_values: List[int], weights: List[int]) -> bool:
+    low = -_SORT_FIELD_BIAS
+    high = _SORT_FIELD_BIAS - 1
+    return (
+        0 <= min(weights)
+        and max(weights) <= 100
+        and low <= min(due_values)
+        and max(due_values) <= high
+        and low <= min(created_values)
+        and max(created_values) <= high
+    )
 
+
+def _packed_sort_keys(
+    entries: List[NagListEntry],
+    sort_mode: str,
+    due_values: List[int],
+    created_values: List[int],
+    context: RefreshContext,
+) -> List[int]:
+    # Same order as the tuple keys, folded into one int per entry so the sort compares
+    # single ints. Weight takes 7 bits (0..100); due/created are biased 64-bit fields.
+    bias = _SORT_FIELD_BIAS
     if sort_mode == SORT_WEIGHT:
-        return sorted(entries, key=lambda e: (-e.nag.weight, entry_due_ms(e), e.nag.created_at_epoch_ms))
+        return [
+            ((100 - e.nag.weight) << 128) | ((due + bias) << 64) | (created + bias)
+            for e, due, created in zip(entries, due_values, created_values)
+        ]
     if sort_mode == SORT_DUE:
-        return sorted(entries, key=lambda e: (entry_due_ms(e), -e.nag.weight, e.nag.created_at_epoch_ms))
+        return [
+            ((due + bias) << 71) | ((100 - e.nag.weight) << 64) | (created + bias)
+            for e, due, created in zip(entries, due_values, created_values)
+        ]
     if sort_mode == SORT_SMART:
-        return sorted(
-            entries,
-            key=lambda e: (
-                smart_status_rank(entry_due_ms(e), now_ms_value),
-                -e.nag.weight,
-                entry_due_ms(e),
-                e.nag.created_at_epoch_ms,
-            ),
-        )
-    return sorted(entries, key=lambda e: (e.nag.created_at_epoch_ms, entry_due_ms(e)))
+        return [
+            (smart_status_rank(due, context) << 135)
+            | ((100 - e.nag.weight) << 128)
+            | ((due + bias) << 64)
+            | (created + bias)
+            for e, due, created in zip(entries, due_values, created_values)
+        ]
+    return [((created + bias) << 64) | (due + bias) for due, created in zip(due_values, created_values)]
+
+
+def _tuple_sort_keys(
+    entries: List[NagListEntry],
+    sort_mode: str,
+    due_values: List[int],
+    created_values: List[int],
+    context: RefreshContext,
+) -> List[Tuple[int, ...]]:
+    if sort_mode == SORT_WEIGHT:
+        return [(-e.nag.weight, due, created) for e, due, created in zip(entries, due_values, created_values)]
+    if sort_mode == SORT_DUE:
+        return [(due, -e.nag.weight, created) for e, due, created in zip(entries, due_values, created_values)]
+    if sort_mode == SORT_SMART:
+        return [
+            (smart_status_rank(due, context), -e.nag.weight, due, created)
+            for e, due, created in zip(entries, due_values, created_values)
+        ]
+    return [(created, due) for due, created in zip(due_values, created_values)]
 
 
+@functools.lru_cache(maxsize=512)
 def overdue_window_ms(lateness_days: int) -> int:
-    return max(1, lateness_days) * 24 * 60 * 60 * 1000
+    return max(1, lateness_days) * DAY_MS
 
 
 def progress_fraction(now_ms_value: int, start_ms: int, end_ms: int) -> float:
@@ -819,7 +1434,7 @@ def progress_percent_label(now_ms_value: int, start_ms: int, due_ms: int, latene
 def recurring_indicator_label(nag: Nag) -> str:
     if nag.mode != NAG_MODE_MONTHLY:
         return ""
-    pattern = nag.recurring_pattern_type or PATTERN_DAY_OF_MONTH
+    pattern = nag.recurring_pattern_type
     if pattern == PATTERN_DAY_OF_MONTH:
         return "R:M"
     if pattern == PATTERN_DAY_OF_WEEK:
@@ -841,74 +1456,206 @@ def push_summary_label(nag: Nag) -> str:
     return f"P{nag.push_count}+{format_duration_compact(nag.pushed_total_ms)}"
 
 
+VISUAL_FAR_FUTURE = 0
+VISUAL_PRE_DUE = 1
+VISUAL_OVERDUE = 2
+
+
+ColorPair = Tuple[Tuple[int, int, int], Tuple[int, int, int]]
+
+# Colours depend only on the branch and the clamped weight, so each branch is a
+# small table filled once per palette; see _rebuild_color_tables.
+_FAR_FUTURE_COLORS: List[ColorPair] = []
+_PRE_DUE_TABLE: List[ColorPair] = []
+_OVERDUE_TABLE: List[ColorPair] = []
+
+
+def _pre_due_colors(yellow_strength: float) -> ColorPair:
+    pre_base = _THEME_RGB["pre_due_base"]
+    return (
+        lerp_alpha_over_white((255, 255, 255), pre_base, yellow_strength, 0.18 + 0.60 * yellow_strength),
+        lerp_alpha_over_white(pre_base, _THEME_RGB["pre_due_progress"], yellow_strength, 0.30 + 0.55 * yellow_strength),
+    )
+
+
+def _overdue_colors(red_strength: float) -> ColorPair:
+    overdue_base = _THEME_RGB["overdue_base"]
+    return (
+        lerp_alpha_over_white((255, 255, 255), overdue_base, red_strength, 0.28 + 0.45 * red_strength),
+        lerp_alpha_over_white(overdue_base, _THEME_RGB["overdue_progress"], red_strength, 0.60 + 0.35 * red_strength),
+    )
+
+
+def _rebuild_color_tables() -> None:
+    # Index i is weight i (pre-due) or weight 50 + i (overdue); strengths are exactly i / 50.
+    _FAR_FUTURE_COLORS[:] = [
+        (_THEME_RGB["far_future_base"], alpha_over_white(_THEME_RGB["far_future_progress"], 0.18))
+    ]
+    _PRE_DUE_TABLE[:] = [_pre_due_colors(index / 50.0) for index in range(51)]
+    _OVERDUE_TABLE[:] = [_overdue_colors(index / 50.0) for index in range(51)]
+
+
+_rebuild_color_tables()
+
+
+def _branch_colors(branch: int, weight: int) -> ColorPair:
+    if branch == VISUAL_OVERDUE:
+        return _OVERDUE_TABLE[max(0, min(50, weight - 50))]
+    if branch == VISUAL_PRE_DUE:
+        return _PRE_DUE_TABLE[max(0, min(50, weight))]
+    return _FAR_FUTURE_COLORS[0]
+
+
+def _empty_line_visual() -> NagLineVisual:
+    return NagLineVisual(
+        base_color=EMPTY_BASE_RGB,
+        progress_color=EMPTY_PROGRESS_RGB,
+        progress_fraction=0.0,
+        text_color="#000000",
+        time_label="",
+        percent_label="",
+    )
+
+
+def _visual_colors(
+    now_ms_value: int,
+    start_ms: int,
+    due_ms: int,
+    weight: int,
+    overdue_ms: int,
+) -> Tuple[Tuple[int, int, int], Tuple[int, int, int], float]:
+    # Numeric core of a row visual: plain numbers in, colours and progress fraction out.
+    if now_ms_value > due_ms:
+        base_color, progress_color = _branch_colors(VISUAL_OVERDUE, weight)
+        return base_color, progress_color, progress_fraction(now_ms_value, due_ms, due_ms + overdue_ms)
+    branch = VISUAL_FAR_FUTURE if due_ms - now_ms_value > PRE_DUE_COLOR_WINDOW_MS else VISUAL_PRE_DUE
+    base_color, progress_color = _branch_colors(branch, weight)
+    return base_color, progress_color, progress_fraction(now_ms_value, start_ms, due_ms)
+
+
+def _visual_for_window(
+    nag: Nag,
+    due_window: DueWindow,
+    now_ms_value: int,
+) -> NagLineVisual:
+    due_ms = due_window.due_ms
+    overdue_ms = overdue_window_ms(nag.lateness_days)
+    base_color, progress_color, fraction = _visual_colors(
+        now_ms_value, due_window.start_ms, due_ms, nag.weight, overdue_ms
+    )
+    return NagLineVisual(
+        base_color=base_color,
+        progress_color=progress_color,
+        progress_fraction=fraction,
+        text_color="#ffffff" if (now_ms_value > due_ms and nag.weight >= 100) else "#000000",
+        time_label=due_status_label(now_ms_value, due_ms),
+        percent_label=progress_percent_label(now_ms_value, due_window.start_ms, due_ms, nag.lateness_days),
+    )
+
+
 def nag_line_visual(nag: Nag, now_ms_value: int, due_window_override: Optional[DueWindow]) -> NagLineVisual:
     due_window = due_window_override or resolve_due_window(nag, now_ms_value)
     if due_window is None:
-        return NagLineVisual(
-            base_color=hex_to_rgb("#ffffff"),
-            progress_color=hex_to_rgb("#ededed"),
-            progress_fraction=0.0,
-            text_color="#000000",
-            time_label="",
-            percent_label="",
-        )
+        return _empty_line_visual()
+    return _visual_for_window(nag, due_window, now_ms_value)
 
-    due_ms = due_window.due_ms
-    time_label = due_status_label(now_ms_value, due_ms)
-    percent_label = progress_percent_label(now_ms_value, due_window.start_ms, due_ms, nag.lateness_days)
-    text_color = "#ffffff" if (now_ms_value > due_ms and nag.weight >= 100) else "#000000"
 
-    pre_base = hex_to_rgb(COLOR_THEME["pre_due_base"])
-    pre_progress = hex_to_rgb(COLOR_THEME["pre_due_progress"])
-    overdue_base = hex_to_rgb(COLOR_THEME["overdue_base"])
-    overdue_progress = hex_to_rgb(COLOR_THEME["overdue_progress"])
-    far_base = hex_to_rgb(COLOR_THEME["far_future_base"])
-    far_progress = hex_to_rgb(COLOR_THEME["far_future_progress"])
+VisualCache = Dict[str, Tuple[Tuple[int, ...], NagLineVisual]]
 
-    if now_ms_value <= due_ms:
-        pre_due_progress = progress_fraction(now_ms_value, due_window.start_ms, due_ms)
-        millis_until_due = due_ms - now_ms_value
-        pre_due_window_ms = PRE_DUE_COLOR_WINDOW_DAYS * 24 * 60 * 60 * 1000
-
-        if millis_until_due > pre_due_window_ms:
-            return NagLineVisual(
-                base_color=far_base,
-                progress_color=alpha_over_white(far_progress, 0.18),
-                progress_fraction=pre_due_progress,
-                text_color=text_color,
-                time_label=time_label,
-                percent_label=percent_label,
-            )
 
-        yellow_strength = max(0.0, min(1.0, nag.weight / 50.0))
-        base_yellow = lerp_color((255, 255, 255), pre_base, yellow_strength)
-        base_yellow = alpha_over_white(base_yellow, 0.18 + 0.60 * yellow_strength)
-        progress_yellow = lerp_color(pre_base, pre_progress, yellow_strength)
-        progress_yellow = alpha_over_white(progress_yellow, 0.30 + 0.55 * yellow_strength)
-        return NagLineVisual(
-            base_color=base_yellow,
-            progress_color=progress_yellow,
-            progress_fraction=pre_due_progress,
-            text_color=text_color,
-            time_label=time_label,
-            percent_label=percent_label,
-        )
+def cached_line_visual(entry: NagListEntry, context: RefreshContext, cache: VisualCache) -> NagLineVisual:
+    # A row is reused while its inputs and whole minutes to/since due are unchanged, which keeps
+    # minute-or-coarser labels exact; rows within a minute of due always recompute.
+    now_ms_value = context.now_ms
+    nag = entry.nag
+    due_window = entry.due_window or resolve_due_window(nag, now_ms_value)
+    if due_window is None:
+        return _empty_line_visual()
+    offset_ms = due_window.due_ms - now_ms_value
+    if abs(offset_ms) < MINUTE_MS:
+        return _visual_for_window(nag, due_window, now_ms_value)
+    signature = (
+        due_window.start_ms,
+        due_window.due_ms,
+        nag.weight,
+        nag.lateness_days,
+        offset_ms >= 0,
+        abs(offset_ms) // MINUTE_MS,
+    )
+    cached = cache.get(entry.key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    visual = _visual_for_window(nag, due_window, now_ms_value)
+    cache[entry.key] = (signature, visual)
+    return visual
 
-    red_strength = max(0.0, min(1.0, (max(50, min(100, nag.weight)) - 50) / 50.0))
-    base_red = lerp_color((255, 255, 255), overdue_base, red_strength)
-    base_red = alpha_over_white(base_red, 0.28 + 0.45 * red_strength)
-    progress_red = lerp_color(overdue_base, overdue_progress, red_strength)
-    progress_red = alpha_over_white(progress_red, 0.60 + 0.35 * red_strength)
-    post_progress = progress_fraction(now_ms_value, due_ms, due_ms + overdue_window_ms(nag.lateness_days))
 
-    return NagLineVisual(
-        base_color=base_red,
-        progress_color=progress_red,
-        progress_fraction=post_progress,
-        text_color=text_color,
-        time_label=time_label,
-        percent_label=percent_label,
-    )
+_EPOCH_UTC = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_ONE_MICROSECOND = dt.timedelta(microseconds=1)
+ISO_FRACTION_RE = re.compile(r"\.(\d+)")
+
+
+# PostgREST repeats the same created_at strings across pages and the fallback table.
+@functools.lru_cache(maxsize=65536)
+def parse_timestamp_us(text: str) -> Optional[int]:
+    value = text.strip()
+    if not value:
+        return None
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    # Older fromisoformat only accepts 3 or 6 fraction digits; Postgres trims trailing zeros.
+    value = ISO_FRACTION_RE.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), value, count=1)
+    try:
+        parsed = dt.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return (parsed - _EPOCH_UTC) // _ONE_MICROSECOND
+
+
+def row_icon_base64(row: Dict[str, Any]) -> Optional[str]:
+    # Normalised on first use and kept on the row; dedup and the rebuild both ask for it.
+    if "_normalized_icon" not in row:
+        row["_normalized_icon"] = normalize_icon_png_base64(row.get("icon_png_base64"))
+    return row["_normalized_icon"]
+
+
+def _created_at_key(row: Dict[str, Any]) -> int:
+    # Stamped while pages arrive; rows from elsewhere are parsed on first use. -1 sorts unparseable rows first.
+    created_us = row.get("_created_us")
+    if created_us is None:
+        parsed = parse_timestamp_us(str(row.get("created_at") or ""))
+        created_us = row["_created_us"] = -1 if parsed is None else parsed
+    return created_us
+
+
+def _is_sorted_by_created_at(rows: List[Dict[str, Any]]) -> bool:
+    keys = [row["_created_us"] for row in rows]
+    return all(a <= b for a, b in zip(keys, keys[1:]))
+
+
+def _dumps_canonical(value: Any) -> bytes:
+    # orjson matches the compact sorted-key json.dumps text for ASCII output; anything it
+    # would spell differently (non-ASCII, non-str keys, huge ints) goes through json.
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            encoded = b""
+        if encoded and encoded.isascii():
+            return encoded
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return text.encode("ascii")
+
+
+def payload_fingerprint(payload_value: Any) -> bytes:
+    # 16-byte digest of the canonical text; the dedup map keeps this instead of the full string.
+    if isinstance(payload_value, (dict, list)):
+        data = _dumps_canonical(payload_value)
+    else:
+        data = str(payload_value).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 class SupabaseSession:
@@ -920,6 +1667,13 @@ class SupabaseSession:
         self.table_name: Optional[str] = None
         self.table_row_counts: Dict[str, int] = {}
         self.table_fetch_errors: Dict[str, str] = {}
+        self._http = self._new_http_session()
+
+    def _new_http_session(self) -> requests.Session:
+        # Only Supabase is reached through this pool, so the apikey can ride on the session.
+        http = build_http_session(pool_maxsize=16, retries=3, status_forcelist=(502, 503, 504))
+        http.headers.update({"apikey": self.supabase_key})
+        return http
 
     @property
     def signed_in(self) -> bool:
@@ -931,18 +1685,19 @@ class SupabaseSession:
         self.table_name = None
         self.table_row_counts = {}
         self.table_fetch_errors = {}
+        self._http.close()
+        self._http = self._new_http_session()
 
     def sign_in(self, email: str, password: str) -> str:
         endpoint = f"{self.supabase_url}/auth/v1/token?grant_type=password"
         headers = {
-            "apikey": self.supabase_key,
             "Content-Type": "application/json",
         }
         payload = {
             "email": email.strip(),
             "password": password,
         }
-        response = requests.post(endpoint, headers=headers, json=payload, timeout=25)
+        response = self._http.post(endpoint, headers=headers, json=payload, timeout=25)
         if response.status_code >= 300:
             raise RuntimeError(self._extract_error(response))
         body = response.json()
@@ -957,7 +1712,7 @@ class SupabaseSession:
 
     def change_password(self, new_password: str) -> None:
         endpoint = f"{self.supabase_url}/auth/v1/user"
-        response = requests.put(
+        response = self._http.put(
             endpoint,
             headers=self._auth_headers(include_json=True),
             json={"password": new_password},
@@ -970,7 +1725,6 @@ class SupabaseSession:
         if not self.access_token:
             raise RuntimeError("Not signed in.")
         headers = {
-            "apikey": self.supabase_key,
             "Authorization": f"Bearer {self.access_token}",
         }
         if include_json:
@@ -1009,84 +1763,136 @@ class SupabaseSession:
     def detect_table(self) -> str:
         if self.table_name:
             return self.table_name
+        known_table = _KNOWN_GOOD_TABLE.get(self.supabase_url)
+        if known_table:
+            self.table_name = known_table
+            return known_table
         headers = self._auth_headers(include_json=False)
         last_error: Optional[str] = None
-        for table in TABLE_CANDIDATES:
+        candidates = [t for t in TABLE_CANDIDATES if (self.supabase_url, t) not in _KNOWN_MISSING_TABLES]
+        for table in candidates or TABLE_CANDIDATES:
             url = f"{self.supabase_url}/rest/v1/{table}"
             params = {
                 "select": "id",
                 "limit": "1",
             }
-            response = requests.get(url, headers=headers, params=params, timeout=20)
+            response = self._http.get(url, headers=headers, params=params, timeout=20)
             if response.status_code in (200, 206):
                 self.table_name = table
+                _KNOWN_GOOD_TABLE[self.supabase_url] = table
                 return table
 
             body_text = (response.text or "").lower()
-            if "does not exist" in body_text and "relation" in body_text:
-                continue
-            if response.status_code == 404:
+            if ("does not exist" in body_text and "relation" in body_text) or response.status_code == 404:
+                _KNOWN_MISSING_TABLES.add((self.supabase_url, table))
                 continue
             if response.status_code in (401, 403) or "permission denied" in body_text:
+                # Credentials or policies may have changed; do not trust earlier probes.
+                forget_table_detection(self.supabase_url)
                 self.table_name = table
                 return table
             last_error = self._extract_error(response)
 
         raise RuntimeError(last_error or "Unable to find a usable table (nag/events).")
 
-    def fetch_events(self) -> List[Dict[str, Any]]:
+    def _iter_table_pages(
+        self,
+        table: str,
+        headers: Dict[str, str],
+        since_created_at: Optional[str] = None,
+    ) -> Iterator[List[Any]]:
+        step = 1000
+        # Keyset pagination on (created_at, id): each page starts after the last row seen
+        # instead of making Postgres skip every earlier row again.
+        cursor: Optional[Tuple[Any, Any]] = None
+        offset = 0
+        rows_seen = 0
+        while True:
+            params = {
+                "select": EXTENDED_EVENT_SELECT_COLUMNS,
+                "order": "created_at.asc,id.asc",
+                "limit": str(step),
+            }
+            if since_created_at:
+                params["created_at"] = f"gt.{since_created_at}"
+            if cursor is not None:
+                created_at, row_id = cursor
+                params["or"] = (
+                    f'(created_at.gt."{created_at}",and(created_at.eq."{created_at}",id.gt."{row_id}"))'
+                )
+            elif offset:
+                params["offset"] = str(offset)
+            response = self._http.get(
+                f"{self.supabase_url}/rest/v1/{table}",
+                headers=headers,
+                params=params,
+                timeout=30,
+            )
+            if response.status_code >= 300 and self._is_missing_optional_column_error(response):
+                params["select"] = CORE_EVENT_SELECT_COLUMNS
+                response = self._http.get(
+                    f"{self.supabase_url}/rest/v1/{table}",
+                    headers=headers,
+                    params=params,
+                    timeout=30,
+                )
+            if response.status_code >= 300:
+                raise RuntimeError(self._extract_error(response))
+            batch = _json_loads(response.content)
+            # Drop the body before the caller works on the page so only one copy is alive.
+            del response
+            if not isinstance(batch, list):
+                raise RuntimeError("Unexpected response format while loading rows.")
+            rows_seen += len(batch)
+            last_row = batch[-1] if batch else None
+            yield batch
+            if len(batch) < step:
+                return
+            if not offset and isinstance(last_row, dict) and last_row.get("created_at"):
+                cursor = (last_row["created_at"], last_row.get("id"))
+            else:
+                # Rows without keys sort last; reach the rest by offset from here on.
+                cursor = None
+                offset = rows_seen
+
+    def _fetch_table_rows(
+        self,
+        table: str,
+        headers: Dict[str, str],
+        since_created_at: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        # Rows are tagged as each page arrives instead of in a second pass over the table.
+        for batch in self._iter_table_pages(table, headers, since_created_at):
+            for event in batch:
+                if isinstance(event, dict):
+                    event["_source_table"] = table
+                    _created_at_key(event)
+            events.extend(batch)
+        return events
+
+    def fetch_events(self, since_created_at: Optional[str] = None) -> List[Dict[str, Any]]:
+        # With since_created_at only newer rows are fetched and counted on top of the last load.
         if not self.user_id:
             raise RuntimeError("Not signed in.")
         self.detect_table()
+        previous_counts = self.table_row_counts if since_created_at else {}
         self.table_row_counts = {}
         self.table_fetch_errors = {}
         headers = self._auth_headers(include_json=False)
-        merged_events: List[Dict[str, Any]] = []
+        table_events: List[List[Dict[str, Any]]] = []
         errors: List[str] = []
         table_order = [self.table_name] + [t for t in TABLE_CANDIDATES if t != self.table_name]
 
-        for table in table_order:
-            if not table:
-                continue
-            events: List[Dict[str, Any]] = []
-            step = 1000
-            offset = 0
+        tables = [table for table in table_order if table]
+        # Tables are independent endpoints, so fetch them side by side and merge in table order.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(tables))) as pool:
+            fetches = [pool.submit(self._fetch_table_rows, table, headers, since_created_at) for table in tables]
+        for table, fetch in zip(tables, fetches):
             try:
-                while True:
-                    params = {
-                        "select": EXTENDED_EVENT_SELECT_COLUMNS,
-                        "order": "created_at.asc",
-                        "limit": str(step),
-                        "offset": str(offset),
-                    }
-                    response = requests.get(
-                        f"{self.supabase_url}/rest/v1/{table}",
-                        headers=headers,
-                        params=params,
-                        timeout=30,
-                    )
-                    if response.status_code >= 300 and self._is_missing_optional_column_error(response):
-                        params["select"] = CORE_EVENT_SELECT_COLUMNS
-                        response = requests.get(
-                            f"{self.supabase_url}/rest/v1/{table}",
-                            headers=headers,
-                            params=params,
-                            timeout=30,
-                        )
-                    if response.status_code >= 300:
-                        raise RuntimeError(self._extract_error(response))
-                    batch = response.json()
-                    if not isinstance(batch, list):
-                        raise RuntimeError("Unexpected response format while loading rows.")
-                    events.extend(batch)
-                    if len(batch) < step:
-                        break
-                    offset += step
-                self.table_row_counts[table] = len(events)
-                for event in events:
-                    if isinstance(event, dict):
-                        event["_source_table"] = table
-                    merged_events.append(event)
+                events = fetch.result()
+                self.table_row_counts[table] = previous_counts.get(table, 0) + len(events)
+                table_events.append(events)
             except Exception as exc:
                 error_text = str(exc)
                 normalized = error_text.lower()
@@ -1102,31 +1908,36 @@ class SupabaseSession:
                 errors.append(f"{table}: {error_text}")
                 continue
 
-        if not self.table_row_counts:
+        if not self.table_row_counts or (since_created_at and errors):
+            # A partial incremental load would move the cursor past rows it never saw.
             detail = "; ".join(errors) if errors else "No accessible tables found."
             raise RuntimeError(f"Unable to load from nag/events. {detail}")
 
         self.table_name = max(self.table_row_counts.items(), key=lambda item: item[1])[0]
 
-        dedup: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
-        for event in merged_events:
-            payload_value = event.get("payload")
-            if isinstance(payload_value, (dict, list)):
-                payload_key = json.dumps(payload_value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-            else:
-                payload_key = str(payload_value)
+        # Each table arrives ordered by created_at, so a k-way merge keeps the dedup map in
+        # final order and the full re-sort is only needed if a table comes back unordered.
+        presorted = all(_is_sorted_by_created_at(events) for events in table_events)
+        if presorted:
+            merged_rows: Iterator[Dict[str, Any]] = heapq.merge(*table_events, key=_created_at_key)
+        else:
+            merged_rows = itertools.chain.from_iterable(table_events)
+        dedup: Dict[Tuple[Any, str, bytes], Dict[str, Any]] = {}
+        for event in merged_rows:
+            created_us = event["_created_us"]
             dedup_key = (
-                str(event.get("created_at", "")),
+                # Unparseable timestamps keep their raw text so distinct values never collide.
+                created_us if created_us >= 0 else str(event.get("created_at", "")),
                 str(event.get("user_id", "")),
-                payload_key,
+                payload_fingerprint(event.get("payload")),
             )
             existing = dedup.get(dedup_key)
             if existing is None:
                 dedup[dedup_key] = event
                 continue
 
-            incoming_has_icon = normalize_icon_png_base64(event.get("icon_png_base64")) is not None
-            existing_has_icon = normalize_icon_png_base64(existing.get("icon_png_base64")) is not None
+            incoming_has_icon = row_icon_base64(event) is not None
+            existing_has_icon = row_icon_base64(existing) is not None
             if incoming_has_icon and not existing_has_icon:
                 dedup[dedup_key] = event
                 continue
@@ -1137,26 +1948,37 @@ class SupabaseSession:
                     dedup[dedup_key] = event
 
         rows = list(dedup.values())
-        rows.sort(key=lambda row: str(row.get("created_at", "")))
+        if not presorted:
+            rows.sort(key=_created_at_key)
         return rows
 
     def insert_event(self, payload: Dict[str, Any]) -> None:
+        self._insert_rows([payload])
+
+    def insert_events(self, payloads: List[Dict[str, Any]]) -> int:
+        # PostgREST takes a JSON array as one bulk insert; batches keep a bad row from sinking everything.
+        for start in range(0, len(payloads), INSERT_BATCH_SIZE):
+            try:
+                self._insert_rows(payloads[start : start + INSERT_BATCH_SIZE])
+            except RuntimeError as exc:
+                raise RuntimeError(f"{exc} (synced {start} of {len(payloads)})") from exc
+        return len(payloads)
+
+    def _insert_rows(self, payloads: List[Dict[str, Any]]) -> None:
         if not self.user_id:
             raise RuntimeError("Not signed in.")
 
-        row = {
-            "payload": payload,
-            "user_id": self.user_id,
-        }
+        rows = [{"payload": payload, "user_id": self.user_id} for payload in payloads]
+        body: Any = rows[0] if len(rows) == 1 else rows
 
         table_order = [self.detect_table()] + [t for t in TABLE_CANDIDATES if t != self.table_name]
         last_error: Optional[str] = None
 
         for table in table_order:
-            response = requests.post(
+            response = self._http.post(
                 f"{self.supabase_url}/rest/v1/{table}",
                 headers={**self._auth_headers(include_json=True), "Prefer": "return=minimal"},
-                json=row,
+                json=body,
                 timeout=30,
             )
             if response.status_code < 300:
@@ -1170,6 +1992,214 @@ class SupabaseSession:
 
         raise RuntimeError(last_error or "Insert failed")
 
+
+@dataclass(slots=True)
+class PendingChange:
+    # A local edit applied ahead of its Supabase insert; previous is what a failed insert restores.
+    action: str
+    nag: Nag
+    previous: Optional[Nag]
+
+
+@dataclass
+class ReloadResult:
+    row_count: int
+    nags_by_work: Dict[str, Nag]
+    parseable_rows: int
+    valid_nag_rows: int
+    # created_at of the newest row applied; the next incremental reload starts after it.
+    last_created_at: Optional[str] = None
+
+
+@dataclass
+class ReplayedEvents:
+    # Net effect of replaying rows in order: final Nag per work name (None once deleted), in the
+    # order a step-by-step replay leaves them. Moved names were deleted and then re-created.
+    changes: Dict[str, Optional[Nag]]
+    moved: Set[str]
+    parseable_rows: int
+    valid_nag_rows: int
+    last_created_at: Optional[str]
+
+
+def parse_event_payload(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, dict):
+        if "payload" in value and isinstance(value.get("payload"), (dict, str)):
+            nested = parse_event_payload(value.get("payload"))
+            if nested:
+                return nested
+        return value
+    if isinstance(value, str):
+        # Only object text can yield a payload. Both parsers skip JSON whitespace themselves,
+        # so a stripped copy is only made when the text fails as-is.
+        if "{" not in value:
+            return None
+        try:
+            parsed = _json_loads(value)
+        except Exception:
+            try:
+                parsed = _json_loads(value.strip())
+            except Exception:
+                return None
+        return parsed if isinstance(parsed, dict) else None
+    return None
+
+
+# (source table, row id) -> (digest of payload text and icon, Nag built from it, action).
+# A full replay prunes it to the rows whose Nag is still current, so it stays about one entry
+# per nag; incremental replays only add to it until the next full one.
+_PAYLOAD_NAG_CACHE: Dict[Tuple[str, str], Tuple[bytes, Nag, str]] = {}
+
+
+def _payload_cache_key(row: Dict[str, Any]) -> Tuple[Optional[Tuple[str, str]], bytes]:
+    # Only text payloads are hashed; dict payloads arrive already parsed and go straight through.
+    raw_payload = row.get("payload")
+    raw_icon = row.get("icon_png_base64")
+    if not isinstance(raw_payload, str) or row.get("id") is None:
+        return None, b""
+    if raw_icon is not None and not isinstance(raw_icon, str):
+        return None, b""
+    digest = hashlib.blake2b(raw_payload.encode("utf-8"), digest_size=16)
+    digest.update(b"\x00" if raw_icon is None else b"\x01" + raw_icon.encode("utf-8"))
+    return (str(row.get("_source_table", "")), str(row["id"])), digest.digest()
+
+
+def forget_payload_nag_cache() -> None:
+    _PAYLOAD_NAG_CACHE.clear()
+    # The child process keeps its own copy; dropping the pool discards it.
+    _discard_rebuild_process_pool()
+
+
+def rebuild_current_nags(events: List[Dict[str, Any]], base: Optional[ReloadResult] = None) -> ReloadResult:
+    # With a base, events are only the rows newer than it and are replayed on top of its nags.
+    return merge_replayed_events(base, replay_events(events, prune_cache=base is None), len(events))
+
+
+def merge_replayed_events(base: Optional[ReloadResult], replayed: ReplayedEvents, row_count: int) -> ReloadResult:
+    current: Dict[str, Nag] = dict(base.nags_by_work) if base else {}
+    for work_name, nag in replayed.changes.items():
+        if nag is None or work_name in replayed.moved:
+            current.pop(work_name, None)
+        if nag is not None:
+            current[work_name] = nag
+    return ReloadResult(
+        row_count=(base.row_count if base else 0) + row_count,
+        nags_by_work=current,
+        parseable_rows=(base.parseable_rows if base else 0) + replayed.parseable_rows,
+        valid_nag_rows=(base.valid_nag_rows if base else 0) + replayed.valid_nag_rows,
+        last_created_at=replayed.last_created_at or (base.last_created_at if base else None),
+    )
+
+
+def replay_events(events: List[Dict[str, Any]], prune_cache: bool = False) -> ReplayedEvents:
+    changes: Dict[str, Optional[Nag]] = {}
+    moved: Set[str] = set()
+    parseable_count = 0
+    valid_nag_count = 0
+    last_created_at = None
+    # fetch_events already returns rows in this order, so the stable sort is a single linear pass.
+    sorted_events = sorted(events, key=_created_at_key)
+    if sorted_events and _created_at_key(sorted_events[-1]) >= 0:
+        last_created_at = str(sorted_events[-1]["created_at"])
+    for row in sorted_events:
+        cache_key, digest = _payload_cache_key(row)
+        cached = _PAYLOAD_NAG_CACHE.get(cache_key) if cache_key else None
+        if cached is not None and cached[0] == digest:
+            # Same row, same payload text and icon as last time: reuse the built Nag.
+            _, nag, action = cached
+            parseable_count += 1
+            valid_nag_count += 1
+        else:
+            payload = parse_event_payload(row.get("payload"))
+            if not payload:
+                continue
+            parseable_count += 1
+            nag = Nag.from_payload(payload)
+            if not nag:
+                continue
+            icon_base64 = row_icon_base64(row)
+            if icon_base64:
+                nag.icon_png_base64 = icon_base64
+            valid_nag_count += 1
+            action = str(payload.get("action", "")).strip().lower()
+            # Without createdAtEpochMillis the Nag takes the current time, so it is not reusable.
+            if cache_key and "createdAtEpochMillis" in payload:
+                _PAYLOAD_NAG_CACHE[cache_key] = (digest, nag, action)
+        # A delete, or a re-create after one, moves the name to the end like a pop-and-insert would.
+        work_name = nag.work_name
+        if action == "delete":
+            changes.pop(work_name, None)
+            changes[work_name] = None
+        else:
+            if work_name in changes and changes[work_name] is None:
+                del changes[work_name]
+                moved.add(work_name)
+            changes[work_name] = nag
+    if prune_cache:
+        # The whole history was replayed, so anything not current is a superseded version.
+        current_ids = {id(nag) for nag in changes.values() if nag is not None}
+        stale = [key for key, (_, nag, _) in _PAYLOAD_NAG_CACHE.items() if id(nag) not in current_ids]
+        for key in stale:
+            del _PAYLOAD_NAG_CACHE[key]
+    return ReplayedEvents(
+        changes=changes,
+        moved=moved,
+        parseable_rows=parseable_count,
+        valid_nag_rows=valid_nag_count,
+        last_created_at=last_created_at,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _rebuild_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    # Spawned, not forked: the pool is first created from a worker thread while Tk, image and
+    # HTTP threads hold locks a forked child would inherit.
+    return concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _discard_rebuild_process_pool() -> None:
+    if _rebuild_process_pool.cache_info().currsize:
+        _rebuild_process_pool().shutdown(wait=False, cancel_futures=True)
+        _rebuild_process_pool.cache_clear()
+
+
+def rebuild_current_nags_offloaded(events: List[Dict[str, Any]], base: Optional[ReloadResult] = None) -> ReloadResult:
+    # Large histories are parsed in a child process so the worker thread does not hold the
+    # GIL the Tk thread needs; small ones are not worth the pickling. Only the rows go over;
+    # the result is merged onto base here.
+    if len(events) >= PROCESS_REBUILD_MIN_ROWS:
+        try:
+            future = _rebuild_process_pool().submit(replay_events, events, base is None)
+            replayed = future.result(timeout=PROCESS_REBUILD_TIMEOUT_S)
+            return merge_replayed_events(base, replayed, len(events))
+        except (concurrent.futures.process.BrokenProcessPool, concurrent.futures.TimeoutError):
+            _discard_rebuild_process_pool()
+    return rebuild_current_nags(events, base)
+
+
+def fetch_and_rebuild_nags(session: SupabaseSession, base: Optional[ReloadResult] = None) -> ReloadResult:
+    if base is None or not base.last_created_at:
+        return rebuild_current_nags_offloaded(session.fetch_events())
+    return rebuild_current_nags_offloaded(session.fetch_events(since_created_at=base.last_created_at), base)
+
+
+def parse_int_fields(specs: List[Tuple[str, str, int, int, str]]) -> Tuple[Dict[str, int], List[str]]:
+    # Validates every (name, text, low, high, range message) field in one pass and reports all errors.
+    values: Dict[str, int] = {}
+    errors: List[str] = []
+    for field_name, raw, low, high, range_message in specs:
+        text = raw.strip()
+        if not WHOLE_NUMBER_RE.fullmatch(text):
+            errors.append(f"{field_name} must be a whole number.")
+            continue
+        value = int(text)
+        if value < low or value > high:
+            errors.append(range_message)
+            continue
+        values[field_name] = value
+    return values, errors
+
+
 class NagDialog(tk.Toplevel):
     def __init__(self, parent: tk.Tk, nag: Optional[Nag], buckets: List[str]):
         super().__init__(parent)
@@ -1191,7 +2221,7 @@ class NagDialog(tk.Toplevel):
             continue_minutes=24 * 60,
             notifications_enabled=True,
             weight=50,
-            one_time_epoch_ms=now_value + 24 * 60 * 60 * 1000,
+            one_time_epoch_ms=now_value + DAY_MS,
             monthly_day=1,
             monthly_hour=9,
             monthly_minute=0,
@@ -1222,7 +2252,7 @@ class NagDialog(tk.Toplevel):
         self.monthly_day_var = tk.StringVar(value=str(base.monthly_day or 1))
         self.monthly_hour_var = tk.StringVar(value=str(base.monthly_hour or 9))
         self.monthly_minute_var = tk.StringVar(value=str(base.monthly_minute or 0))
-        self.pattern_var = tk.StringVar(value=base.recurring_pattern_type or PATTERN_DAY_OF_MONTH)
+        self.pattern_var = tk.StringVar(value=base.recurring_pattern_type)
         self.day_of_week_var = tk.StringVar(value=str(base.recurring_day_of_week or JAVA_MONDAY))
         self.nth_week_var = tk.StringVar(value=str(base.recurring_nth_week or 1))
         self.recurring_month_var = tk.StringVar(value=str(base.recurring_month_of_year or ms_to_local(now_value).month))
@@ -1299,12 +2329,6 @@ class NagDialog(tk.Toplevel):
         self.bind("<Return>", lambda _: self._on_save())
         self.bind("<Escape>", lambda _: self._on_cancel())
 
-    def _to_int(self, value: str, field_name: str) -> int:
-        try:
-            return int(value.strip())
-        except Exception:
-            raise ValueError(f"{field_name} must be a whole number.")
-
     def _on_save(self) -> None:
         nag_text = self.nag_text_var.get().strip()
         if not nag_text:
@@ -1319,15 +2343,6 @@ class NagDialog(tk.Toplevel):
                 return
         else:
             project_name = None
-        weight = self._to_int(self.weight_var.get(), "Weight")
-        lateness_days = self._to_int(self.lateness_var.get(), "Lateness days")
-        if weight < 0 or weight > 100:
-            messagebox.showerror("Validation", "Weight must be 0..100.", parent=self)
-            return
-        if lateness_days < 1:
-            messagebox.showerror("Validation", "Lateness days must be at least 1.", parent=self)
-            return
-
         entered = parse_local_datetime(self.entered_var.get())
         if entered is None:
             messagebox.showerror("Validation", "Entered date must be YYYY-MM-DD HH:MM.", parent=self)
@@ -1348,54 +2363,49 @@ class NagDialog(tk.Toplevel):
             if one_time is None:
                 messagebox.showerror("Validation", "One-time due must be YYYY-MM-DD HH:MM.", parent=self)
                 return
-            one_time_ms = local_to_ms(one_time)
-        else:
-            monthly_day = self._to_int(self.monthly_day_var.get(), "Monthly day")
-            monthly_hour = self._to_int(self.monthly_hour_var.get(), "Monthly hour")
-            monthly_minute = self._to_int(self.monthly_minute_var.get(), "Monthly minute")
-            if monthly_day < 1 or monthly_day > 31:
-                messagebox.showerror("Validation", "Monthly day must be 1..31.", parent=self)
-                return
-            if monthly_hour < 0 or monthly_hour > 23:
-                messagebox.showerror("Validation", "Monthly hour must be 0..23.", parent=self)
-                return
-            if monthly_minute < 0 or monthly_minute > 59:
-                messagebox.showerror("Validation", "Monthly minute must be 0..59.", parent=self)
-                return
+            one_time_ms = local_to_ms(one_time)
 
         pattern = self.pattern_var.get().strip().upper() or PATTERN_DAY_OF_MONTH
         if pattern not in PATTERN_OPTIONS:
             pattern = PATTERN_DAY_OF_MONTH
 
-        recurring_day_of_week = self._to_int(self.day_of_week_var.get(), "Day of week")
-        recurring_nth_week = self._to_int(self.nth_week_var.get(), "Nth week")
-        recurring_month = self._to_int(self.recurring_month_var.get(), "Annual month")
-        recurring_quarter_anchor = self._to_int(self.quarter_anchor_var.get(), "Quarter anchor")
-
-        if recurring_day_of_week not in WEEKDAY_OPTIONS:
-            messagebox.showerror("Validation", "Day of week must be 1..7 (Java Calendar style).", parent=self)
-            return
-        if recurring_nth_week not in NTH_WEEK_OPTIONS:
-            messagebox.showerror("Validation", "Nth week must be 1..5.", parent=self)
-            return
-        if recurring_month < 1 or recurring_month > 12:
-            messagebox.showerror("Validation", "Annual month must be 1..12.", parent=self)
-            return
-        if recurring_quarter_anchor < 1 or recurring_quarter_anchor > 12:
-            messagebox.showerror("Validation", "Quarter anchor must be 1..12.", parent=self)
+        int_specs: List[Tuple[str, str, int, int, str]] = [
+            ("Weight", self.weight_var.get(), 0, 100, "Weight must be 0..100."),
+            ("Lateness days", self.lateness_var.get(), 1, 2**31 - 1, "Lateness days must be at least 1."),
+        ]
+        if mode == NAG_MODE_MONTHLY:
+            int_specs += [
+                ("Monthly day", self.monthly_day_var.get(), 1, 31, "Monthly day must be 1..31."),
+                ("Monthly hour", self.monthly_hour_var.get(), 0, 23, "Monthly hour must be 0..23."),
+                ("Monthly minute", self.monthly_minute_var.get(), 0, 59, "Monthly minute must be 0..59."),
+            ]
+        int_specs += [
+            ("Day of week", self.day_of_week_var.get(), 1, 7, "Day of week must be 1..7 (Java Calendar style)."),
+            ("Nth week", self.nth_week_var.get(), 1, 5, "Nth week must be 1..5."),
+            ("Annual month", self.recurring_month_var.get(), 1, 12, "Annual month must be 1..12."),
+            ("Quarter anchor", self.quarter_anchor_var.get(), 1, 12, "Quarter anchor must be 1..12."),
+        ]
+        recurring_visible_raw = self.recurring_visible_days_var.get().strip()
+        if recurring_visible_raw:
+            int_specs.append(
+                ("Recur visible days", recurring_visible_raw, 1, 2**31 - 1, "Recur visible days must be at least 1.")
+            )
+        int_values, int_errors = parse_int_fields(int_specs)
+        if int_errors:
+            messagebox.showerror("Validation", "\n".join(int_errors), parent=self)
             return
 
-        recurring_visible_days: Optional[int]
-        recurring_visible_raw = self.recurring_visible_days_var.get().strip()
-        if not recurring_visible_raw:
-            recurring_visible_days = None
-        else:
-            recurring_visible_days = self._to_int(recurring_visible_raw, "Recur visible days")
-            if recurring_visible_days < 1:
-                messagebox.showerror("Validation", "Recur visible days must be at least 1.", parent=self)
-                return
-        if mode != NAG_MODE_MONTHLY:
-            recurring_visible_days = None
+        weight = int_values["Weight"]
+        lateness_days = int_values["Lateness days"]
+        if mode == NAG_MODE_MONTHLY:
+            monthly_day = int_values["Monthly day"]
+            monthly_hour = int_values["Monthly hour"]
+            monthly_minute = int_values["Monthly minute"]
+        recurring_day_of_week = int_values["Day of week"]
+        recurring_nth_week = int_values["Nth week"]
+        recurring_month = int_values["Annual month"]
+        recurring_quarter_anchor = int_values["Quarter anchor"]
+        recurring_visible_days = int_values.get("Recur visible days") if mode == NAG_MODE_MONTHLY else None
 
         icon = self.icon_var.get().strip() or None
 
@@ -1433,6 +2443,42 @@ class NagDialog(tk.Toplevel):
         self.result = None
         self.destroy()
 
+
+def row_top_px(index: int) -> int:
+    return ROW_TOP_PX + index * ROW_HEIGHT_PX
+
+
+def row_bottom_px(index: int) -> int:
+    return row_top_px(index) + ROW_HEIGHT_PX - 8
+
+
+@dataclass(slots=True)
+class CanvasRowItems:
+    # Canvas item ids for one painted row; recycled across redraws instead of deleted.
+    background: int
+    progress: int
+    icon: int
+    title: int
+    subtitle: int
+    right: int
+    # What the items currently show, so a row repainted unchanged costs no Tcl calls.
+    shown: Optional[Tuple[Any, ...]] = None
+
+
+@dataclass(slots=True)
+class CanvasFrame:
+    # What one redraw resolved for the whole list; rows are drawn from it as they come into view.
+    width: int
+    selected_bucket: str
+    project_overview_mode: bool
+    project_counts: Dict[str, int]
+    context: RefreshContext
+    text_width: int
+    # Row index -> visual, filled as rows are painted; None in project overview (plain rows).
+    visuals: Optional[Dict[int, NagLineVisual]]
+    row_items: Dict[int, CanvasRowItems] = field(default_factory=dict)
+
+
 class NagDesktopApp:
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -1441,30 +2487,73 @@ class NagDesktopApp:
         self._configure_platform_ui()
 
         self.session = SupabaseSession(SUPABASE_URL, SUPABASE_PUBLISHABLE_KEY)
-        self.events: List[Dict[str, Any]] = []
+        # Raw rows (icons included) are dropped once reduced to nags; only the count is kept.
+        self.loaded_row_count = 0
         self.nags_by_work: Dict[str, Nag] = {}
+        self.nag_filter_index: Optional[NagFilterIndex] = None
+        self.bucket_counts: Optional[Dict[str, int]] = None
         self.visible_entries: List[NagListEntry] = []
-        self.row_bounds: List[Tuple[int, int, NagListEntry]] = []
+        # Sorted due times of the visible entries, for the redraw tick's near-due check.
+        self.visible_due_ms: List[int] = []
+        # Row index of each visible entry by key, rebuilt with visible_entries.
+        self.visible_index_by_key: Dict[str, int] = {}
+        # Rows laid out by the last redraw; geometry follows from the index (see row_top_px).
+        self.row_count = 0
         self.selected_key: Optional[str] = None
+        self._selection_rect_item: Optional[int] = None
         self.write_buttons: List[ttk.Button] = []
         self.auto_reload_job: Optional[str] = None
+        self.auto_reload_count = 0
+        self.redraw_tick_job: Optional[str] = None
+        self._redraw_pending = False
+        self._refresh_pending = False
+        self._bucket_options_stale = False
         self.bucket_options: List[str] = [ALL_BUCKET] + DEFAULT_BUCKETS[:]
         self.bucket_buttons: Dict[str, tk.Button] = {}
         self.sort_buttons: Dict[str, tk.Button] = {}
         self.window_buttons: Dict[str, tk.Button] = {}
         self.recurring_buttons: Dict[str, tk.Button] = {}
-        self.row_image_cache: Dict[str, ImageTk.PhotoImage] = {}
-        self.row_image_failures: set[str] = set()
+        # Icon-button groups keyed by their StringVar's Tcl name, with the value each one shows.
+        self.filter_groups: Dict[str, Tuple[tk.StringVar, Dict[str, tk.Button]]] = {}
+        self.filter_shown_values: Dict[str, str] = {}
+        self.row_image_cache: OrderedDict[str, ImageTk.PhotoImage] = OrderedDict()
+        self.row_image_failures: OrderedDict[str, None] = OrderedDict()
+        self.row_image_inflight: Dict[str, concurrent.futures.Future[Image.Image]] = {}
+        self._row_image_poll_job: Optional[str] = None
+        # Images shown per painted row; keeps them alive even after LRU eviction.
+        self.row_images_in_use: Dict[int, ImageTk.PhotoImage] = {}
+        self.canvas_frame: Optional[CanvasFrame] = None
+        self.spare_row_items: Dict[int, CanvasRowItems] = {}
+        self._last_redraw_signature: Optional[Tuple[Any, ...]] = None
+        self.row_text_cache: Dict[str, Tuple[Nag, Tuple[str, bool], str, str]] = {}
+        self.visual_cache: VisualCache = {}
         self._touch_scroll_press_y = 0
         self._touch_scroll_press_x = 0
         self._touch_scroll_dragging = False
         self._touch_scroll_last_y = 0
         self._touch_scroll_threshold_px = 18
+        self._touch_scroll_dead_zone_min = 0
+        self._touch_scroll_dead_zone_max = 0
+        self._drag_max_offset: Optional[float] = None
+        self._drag_last_offset: Optional[float] = None
+        self.canvas_content_height = 0.0
         self._touch_scroll_start_fraction = 0.0
         self._long_press_job: Optional[str] = None
         self._long_press_triggered = False
         self.last_parseable_payload_rows = 0
         self.last_valid_nag_rows = 0
+        self._reload_future: Optional[concurrent.futures.Future[ReloadResult]] = None
+        self.last_reload: Optional[ReloadResult] = None
+        self._session_call_pending = False
+        # Edits already shown locally: queued for the next insert batch (one per work name, see
+        # _queue_event), and the batch in flight.
+        self.pending_changes: Dict[str, PendingChange] = {}
+        self.inflight_changes: List[PendingChange] = []
+        # Edits the running reload's fetch may not include (unsent when it started, or made since,
+        # synced or not); reapplied over its result. Rolled-back edits are removed.
+        self.reload_changes: List[PendingChange] = []
+        # What CREDENTIALS_FILE currently holds, so unchanged sign-ins skip the write.
+        self._saved_credentials: Optional[Dict[str, str]] = None
         self.active_project_name: Optional[str] = None
 
         self.email_var = tk.StringVar()
@@ -1481,12 +2570,23 @@ class NagDesktopApp:
         self.view_days_var = tk.StringVar(value="30 days")
         self.recurring_mode_var = tk.StringVar(value=RECUR_NEXT_ONLY)
         self.project_mode_var = tk.StringVar(value="")
+        # Filter values mirrored into Python so hot paths skip a Tcl getvar per read.
+        self._cached_bucket = ALL_BUCKET
+        self._cached_sort = SORT_SMART
+        self._cached_view_days = "30 days"
+        self._cached_recurring_mode = RECUR_NEXT_ONLY
+        self._mirror_filter_var(self.bucket_var, "_cached_bucket")
+        self._mirror_filter_var(self.sort_var, "_cached_sort")
+        self._mirror_filter_var(self.view_days_var, "_cached_view_days")
+        self._mirror_filter_var(self.recurring_mode_var, "_cached_recurring_mode")
 
         self._build_ui()
         self._load_saved_credentials()
+        _IMAGE_EXECUTOR.submit(trim_icon_cache)
         self._update_auth_indicator()
-        self._redraw_canvas()
+        self._request_redraw()
         self._schedule_auto_reload()
+        self._schedule_redraw_tick()
         self.root.after(400, self.auto_sign_in_if_possible)
 
     def _configure_platform_ui(self) -> None:
@@ -1582,45 +2682,69 @@ class NagDesktopApp:
             button_store=self.recurring_buttons,
             on_select=self.refresh_visible_entries,
         )
-        self.project_nav_frame = ttk.Frame(controls)
-        self.project_nav_frame.grid(row=1, column=0, columnspan=8, padx=6, pady=(0, 4), sticky="w")
-        self.project_nav_label = ttk.Label(self.project_nav_frame, textvariable=self.project_mode_var)
-        self.project_nav_label.grid(row=0, column=0, padx=(0, 8), pady=2, sticky="w")
-        self.project_back_button = ttk.Button(
-            self.project_nav_frame,
-            text="Projects",
-            command=self._go_to_project_overview,
-        )
-        self.project_back_button.grid(row=0, column=1, padx=(0, 4), pady=2, sticky="w")
-        self.project_exit_button = ttk.Button(
-            self.project_nav_frame,
-            text="Normal view",
-            command=self._exit_project_mode,
-        )
-        self.project_exit_button.grid(row=0, column=2, padx=(0, 4), pady=2, sticky="w")
+        # Project navigation and the row menu are built on first use; most sessions need neither.
+        self.controls_frame = controls
+        self.project_nav_frame: Optional[ttk.Frame] = None
         self.write_buttons = []
 
         list_frame = ttk.Frame(main)
         list_frame.pack(fill=tk.BOTH, expand=True)
 
-        self.canvas = tk.Canvas(list_frame, bg="#fafafa", highlightthickness=0)
+        self.canvas = tk.Canvas(list_frame, bg="#fafafa", highlightthickness=0, yscrollcommand=self._on_canvas_yview)
+        self.canvas_path = str(self.canvas)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        self.canvas.bind("<Configure>", lambda _: self._redraw_canvas())
+        self.canvas.bind("<Configure>", lambda _: self._request_redraw())
         self.canvas.bind("<ButtonPress-1>", self.on_canvas_press)
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
         self.canvas.bind("<Double-1>", self.on_canvas_double_click)
         self.canvas.bind("<Button-3>", self.on_canvas_right_click)
 
-        self.canvas.bind("<MouseWheel>", self.on_mousewheel)
-        self.canvas.bind("<Button-4>", self.on_mousewheel_up_linux)
-        self.canvas.bind("<Button-5>", self.on_mousewheel_down_linux)
+        # Wheel scrolling stays in Tcl; newly exposed rows still reach Python via yscrollcommand.
+        self.canvas.bindtags((CANVAS_SCROLL_BINDTAG,) + self.canvas.bindtags())
+        self.canvas.bind_class(
+            CANVAS_SCROLL_BINDTAG,
+            "<MouseWheel>",
+            "if {%D > 0} {%W yview scroll -1 units} elseif {%D < 0} {%W yview scroll 1 units}; break",
+        )
+        self.canvas.bind_class(CANVAS_SCROLL_BINDTAG, "<Button-4>", "%W yview scroll -1 units; break")
+        self.canvas.bind_class(CANVAS_SCROLL_BINDTAG, "<Button-5>", "%W yview scroll 1 units; break")
 
         status = ttk.Label(main, textvariable=self.status_var, anchor="w")
         status.pack(fill=tk.X, pady=(8, 0))
         ttk.Label(main, textvariable=self.user_id_var, anchor="w").pack(fill=tk.X)
 
+        self.row_menu: Optional[tk.Menu] = None
+
+        self._apply_view_only_ui_state()
+        self.update_bucket_options()
+        self._update_project_navigation_ui()
+
+    def _get_project_nav_frame(self) -> ttk.Frame:
+        if self.project_nav_frame is not None:
+            return self.project_nav_frame
+        self.project_nav_frame = ttk.Frame(self.controls_frame)
+        self.project_nav_frame.grid(row=1, column=0, columnspan=8, padx=6, pady=(0, 4), sticky="w")
+        self.project_nav_label = ttk.Label(self.project_nav_frame, textvariable=self.project_mode_var)
+        self.project_nav_label.grid(row=0, column=0, padx=(0, 8), pady=2, sticky="w")
+        self.project_back_button = ttk.Button(
+            self.project_nav_frame,
+            text="Projects",
+            command=self._go_to_project_overview,
+        )
+        self.project_back_button.grid(row=0, column=1, padx=(0, 4), pady=2, sticky="w")
+        self.project_exit_button = ttk.Button(
+            self.project_nav_frame,
+            text="Normal view",
+            command=self._exit_project_mode,
+        )
+        self.project_exit_button.grid(row=0, column=2, padx=(0, 4), pady=2, sticky="w")
+        return self.project_nav_frame
+
+    def _get_row_menu(self) -> tk.Menu:
+        if self.row_menu is not None:
+            return self.row_menu
         self.row_menu = tk.Menu(self.root, tearoff=0)
         self.row_menu.add_command(label="Enter project", command=self.enter_selected_project)
         self.row_menu.add_separator()
@@ -1629,10 +2753,8 @@ class NagDesktopApp:
         self.row_menu.add_command(label="Complete recurring occurrence", command=self.complete_selected_occurrence)
         self.row_menu.add_separator()
         self.row_menu.add_command(label="Delete", command=self.delete_selected)
-
         self._apply_view_only_ui_state()
-        self.update_bucket_options()
-        self._update_project_navigation_ui()
+        return self.row_menu
 
     def _render_icon_button_group(
         self,
@@ -1643,30 +2765,50 @@ class NagDesktopApp:
         button_store: Dict[str, tk.Button],
         on_select: Any,
     ) -> None:
-        for child in container.winfo_children():
-            child.destroy()
-        button_store.clear()
-        for col, option in enumerate(options):
-            button = tk.Button(
-                container,
-                text=icon_for(option),
-                font=("Segoe UI Emoji", 16),
-                width=3,
-                height=1,
-                padx=2,
-                pady=2,
-                command=lambda value=option: self._set_filter_value(selected_value, value, on_select),
-            )
-            button.grid(row=0, column=col, padx=2, pady=2, sticky="w")
-            button_store[option] = button
+        # Buttons are keyed by option and their icon depends only on it, so existing buttons are
+        # kept; only dropped options are destroyed and only new ones created.
+        if list(button_store) != options:
+            for option in [option for option in button_store if option not in options]:
+                button_store.pop(option).destroy()
+            previous = dict(button_store)
+            button_store.clear()
+            for col, option in enumerate(options):
+                button = previous.get(option)
+                if button is None:
+                    button = tk.Button(
+                        container,
+                        text=icon_for(option),
+                        font=("Segoe UI Emoji", 16),
+                        width=3,
+                        height=1,
+                        padx=2,
+                        pady=2,
+                        command=lambda value=option: self._set_filter_value(selected_value, value, on_select),
+                    )
+                button.grid(row=0, column=col, padx=2, pady=2, sticky="w")
+                button_store[option] = button
         self._update_icon_button_state(button_store, selected_value.get())
+        self.filter_groups[str(selected_value)] = (selected_value, button_store)
+        self.filter_shown_values[str(selected_value)] = selected_value.get()
+
+    def _mirror_filter_var(self, var: tk.StringVar, attribute: str) -> None:
+        # A write trace catches every set(), including sign-out and leaving a project.
+        var.trace_add("write", lambda *_: setattr(self, attribute, var.get()))
 
     def _set_filter_value(self, var: tk.StringVar, value: str, on_select: Any) -> None:
         var.set(value)
-        self._update_icon_button_state(self.bucket_buttons, self.bucket_var.get())
-        self._update_icon_button_state(self.sort_buttons, self.sort_var.get())
-        self._update_icon_button_state(self.window_buttons, self.view_days_var.get())
-        self._update_icon_button_state(self.recurring_buttons, self.recurring_mode_var.get())
+        # Vars can also change elsewhere (sign-out, leaving a project), so every group is
+        # checked, but only the two buttons whose selection moved are reconfigured.
+        for name, (group_var, button_store) in self.filter_groups.items():
+            current = group_var.get()
+            shown = self.filter_shown_values.get(name)
+            if current == shown:
+                continue
+            if shown in button_store:
+                button_store[shown].configure(relief=tk.RAISED, bg="#f1f1f1")
+            if current in button_store:
+                button_store[current].configure(relief=tk.SUNKEN, bg="#d8ecff")
+            self.filter_shown_values[name] = current
         on_select()
 
     def _update_icon_button_state(self, button_map: Dict[str, tk.Button], selected_value: str) -> None:
@@ -1678,20 +2820,7 @@ class NagDesktopApp:
 
     @staticmethod
     def _bucket_icon(bucket_name: str) -> str:
-        text = bucket_name.strip().lower()
-        if text == ALL_BUCKET.lower():
-            return "🧺"
-        if text == "work":
-            return "💼"
-        if text == "personal":
-            return "👤"
-        if text == "weekend":
-            return "🌴"
-        if text == "holiday":
-            return "🎉"
-        if text == PROJECT_BUCKET.lower():
-            return "🗂️"
-        return "🏷️"
+        return BUCKET_ICON_MAP.get(bucket_name.strip().lower(), "🏷️")
 
     def _load_saved_credentials(self) -> None:
         try:
@@ -1701,6 +2830,7 @@ class NagDesktopApp:
                 data = json.load(handle)
             email = str(data.get("email", "")).strip()
             password = str(data.get("password", ""))
+            self._saved_credentials = {"email": email, "password": password}
             if email:
                 self.email_var.set(email)
             if password:
@@ -1711,13 +2841,20 @@ class NagDesktopApp:
 
     def _save_credentials(self, email: str, password: str) -> None:
         data = {"email": email.strip(), "password": password}
+        if data == self._saved_credentials:
+            return
+        # Write a sibling file and swap it in so a crash never leaves a torn credentials file.
+        temp_path = f"{CREDENTIALS_FILE}.tmp"
         try:
-            with open(CREDENTIALS_FILE, "w", encoding="utf-8") as handle:
+            with open(temp_path, "w", encoding="utf-8") as handle:
                 json.dump(data, handle)
+            os.replace(temp_path, CREDENTIALS_FILE)
+            self._saved_credentials = data
         except Exception:
             return
 
     def _clear_saved_credentials(self) -> None:
+        self._saved_credentials = None
         try:
             if os.path.exists(CREDENTIALS_FILE):
                 os.remove(CREDENTIALS_FILE)
@@ -1734,77 +2871,95 @@ class NagDesktopApp:
     def _schedule_auto_reload(self) -> None:
         self.auto_reload_job = self.root.after(AUTO_RELOAD_INTERVAL_MS, self._auto_reload_tick)
 
+    def _schedule_redraw_tick(self) -> None:
+        # Labels change at minute granularity, so wake on the next minute boundary; switch to
+        # one-second ticks only while some row is within a minute of its due and shows seconds.
+        now_value = now_ms()
+        delay_ms = max(500, MINUTE_MS - now_value % MINUTE_MS)
+        due_values = self.visible_due_ms
+        nearest = bisect.bisect_right(due_values, now_value - MINUTE_MS)
+        if nearest < len(due_values) and due_values[nearest] < now_value + MINUTE_MS:
+            delay_ms = 1000
+        self.redraw_tick_job = self.root.after(delay_ms, self._redraw_tick)
+
+    def _redraw_tick(self) -> None:
+        # Only time moved, so a settled frame just repaints the painted rows whose visual changed.
+        try:
+            if self.visible_entries:
+                if self._redraw_pending or self.canvas_frame is None:
+                    self._request_redraw()
+                else:
+                    self._repaint_stale_rows(RefreshContext.build(now_ms()))
+        finally:
+            self._schedule_redraw_tick()
+
     def _auto_reload_tick(self) -> None:
         try:
+            if refresh_local_tz():
+                self.refresh_visible_entries()
             if self.session.signed_in:
-                self.reload_from_supabase(interactive=False, source_label="hourly auto-reload")
+                # created_at is stamped when a writer's transaction starts, so a row committed after our
+                # fetch can sort before the cursor and never show up incrementally; resync now and then.
+                self.auto_reload_count += 1
+                if self.auto_reload_count % FULL_RELOAD_EVERY_AUTO_RELOADS:
+                    self.reload_from_supabase(interactive=False, source_label="hourly auto-reload", incremental=True)
+                else:
+                    self.reload_from_supabase(interactive=False, source_label="periodic full resync")
         finally:
             self._schedule_auto_reload()
 
-    def on_mousewheel(self, event: tk.Event) -> str:
-        delta = event.delta
-        if delta > 0:
-            self.canvas.yview_scroll(-1, "units")
-        elif delta < 0:
-            self.canvas.yview_scroll(1, "units")
-        return "break"
-
-    def on_mousewheel_up_linux(self, event: tk.Event) -> str:
-        self.canvas.yview_scroll(-1, "units")
-        return "break"
-
-    def on_mousewheel_down_linux(self, event: tk.Event) -> str:
-        self.canvas.yview_scroll(1, "units")
-        return "break"
-
     def on_canvas_press(self, event: tk.Event) -> str:
         self._cancel_long_press()
         self._touch_scroll_press_x = event.x
         self._touch_scroll_press_y = event.y
+        self._touch_scroll_dead_zone_min = event.y - self._touch_scroll_threshold_px
+        self._touch_scroll_dead_zone_max = event.y + self._touch_scroll_threshold_px
         self._touch_scroll_last_y = event.y
         current_view = self.canvas.yview()
         self._touch_scroll_start_fraction = current_view[0] if current_view else 0.0
         self._touch_scroll_dragging = False
+        self._drag_max_offset = None
+        self._drag_last_offset = None
         self._long_press_triggered = False
         self._long_press_job = self.root.after(550, lambda: self._trigger_long_press(event.x, event.y))
         return "break"
 
     def on_canvas_drag(self, event: tk.Event) -> str:
+        # Most motion before a drag starts stays inside the dead zone; bail out on two compares.
+        if (
+            not self._touch_scroll_dragging
+            and self._touch_scroll_dead_zone_min < event.y < self._touch_scroll_dead_zone_max
+        ):
+            return "break"
         if self._long_press_triggered:
             return "break"
 
         # Touch scrolling should start only from vertical movement.
         if not self._touch_scroll_dragging:
-            if abs(event.y - self._touch_scroll_press_y) >= self._touch_scroll_threshold_px:
-                # Arm drag anchor on threshold crossing; avoid first-frame jump.
-                self._touch_scroll_dragging = True
-                self._touch_scroll_press_y = event.y
-                current_view = self.canvas.yview()
-                self._touch_scroll_start_fraction = current_view[0] if current_view else 0.0
-            else:
-                return "break"
+            # Arm drag anchor on threshold crossing; avoid first-frame jump.
+            self._touch_scroll_dragging = True
+            self._touch_scroll_press_y = event.y
+            current_view = self.canvas.yview()
+            self._touch_scroll_start_fraction = current_view[0] if current_view else 0.0
 
         if self._touch_scroll_dragging:
             self._cancel_long_press()
 
         if self._touch_scroll_dragging:
-            scroll_region = self.canvas.cget("scrollregion")
-            if not scroll_region:
-                return
-            try:
-                x0, y0, x1, y1 = [float(v) for v in str(scroll_region).split()]
-            except Exception:
-                return
-
-            content_height = max(0.0, y1 - y0)
-            viewport_height = float(max(1, self.canvas.winfo_height()))
-            max_offset = max(0.0, content_height - viewport_height)
+            # Scroll extent is measured once per drag (or after a redraw), not on every motion event.
+            max_offset = self._drag_max_offset
+            if max_offset is None:
+                viewport_height = float(max(1, self.canvas.winfo_height()))
+                max_offset = self._drag_max_offset = max(0.0, self.canvas_content_height - viewport_height)
             if max_offset <= 0:
                 return
 
             start_offset = self._touch_scroll_start_fraction * max_offset
             total_drag_dy = float(event.y - self._touch_scroll_press_y)
             target_offset = max(0.0, min(max_offset, start_offset - total_drag_dy))
+            if self._drag_last_offset is not None and abs(target_offset - self._drag_last_offset) < 1.0:
+                return "break"
+            self._drag_last_offset = target_offset
             self.canvas.yview_moveto(target_offset / max_offset)
         return "break"
 
@@ -1841,20 +2996,23 @@ class NagDesktopApp:
             return
         self.selected_key = entry.key
         can_enter_project = self._is_project_overview_mode() and bool(effective_project_name(entry.nag))
-        self.row_menu.entryconfigure("Enter project", state="normal" if can_enter_project else "disabled")
-        self._redraw_canvas()
+        row_menu = self._get_row_menu()
+        row_menu.entryconfigure("Enter project", state="normal" if can_enter_project else "disabled")
+        self._update_selection_highlight()
         x_root = self.canvas.winfo_rootx() + pointer_x
         y_root = self.canvas.winfo_rooty() + pointer_y
         try:
-            self.row_menu.tk_popup(x_root, y_root)
+            row_menu.tk_popup(x_root, y_root)
         finally:
-            self.row_menu.grab_release()
+            row_menu.grab_release()
 
     def _apply_view_only_ui_state(self) -> None:
         if not VIEW_ONLY_MODE:
             return
         for button in self.write_buttons:
             button.state(["disabled"])
+        if self.row_menu is None:
+            return
         self.row_menu.entryconfigure("Edit", state="disabled")
         self.row_menu.entryconfigure("Push due...", state="disabled")
         self.row_menu.entryconfigure("Complete recurring occurrence", state="disabled")
@@ -1908,8 +3066,17 @@ class NagDesktopApp:
         if new_password != confirm_password.strip():
             messagebox.showerror("Validation", "Passwords do not match.", parent=self.root)
             return
+        if self._session_call_pending:
+            return
+        self.set_status("Changing password...")
+        self._run_session_call(
+            functools.partial(self.session.change_password, new_password),
+            functools.partial(self._finish_change_password, new_password),
+        )
+
+    def _finish_change_password(self, new_password: str, future: concurrent.futures.Future[Any]) -> None:
         try:
-            self.session.change_password(new_password)
+            future.result()
             email = self.email_var.get().strip()
             if email:
                 self._save_credentials(email, new_password)
@@ -1920,15 +3087,49 @@ class NagDesktopApp:
             self.set_status(f"Password change failed: {exc}")
             messagebox.showerror("Password change failed", str(exc), parent=self.root)
 
+    def _run_session_call(self, work: Any, on_done: Any) -> None:
+        # Auth calls and inserts block on the network, so they run on the worker pool with the login buttons
+        # disabled (no sign-out can race them); on_done gets the future back on the Tk thread.
+        self._session_call_pending = True
+        for button in (self.sign_in_button, self.sign_out_button, self.change_password_button):
+            button.state(["disabled"])
+        future = _EXECUTOR.submit(work)
+        self.root.after(RELOAD_POLL_INTERVAL_MS, self._poll_session_call, future, on_done)
+
+    def _poll_session_call(self, future: concurrent.futures.Future[Any], on_done: Any) -> None:
+        if not future.done():
+            self.root.after(RELOAD_POLL_INTERVAL_MS, self._poll_session_call, future, on_done)
+            return
+        self._session_call_pending = False
+        for button in (self.sign_in_button, self.sign_out_button, self.change_password_button):
+            button.state(["!disabled"])
+        on_done(future)
+        self._send_pending_changes()
+
     def sign_in(self, interactive: bool = True) -> None:
+        if self._session_call_pending:
+            return
         email = self.email_var.get().strip()
         password = self.password_var.get()
         if not email or not password:
             if interactive:
                 messagebox.showwarning("Missing", "Enter email and password first.", parent=self.root)
             return
+        self.set_status("Signing in...")
+        self._run_session_call(
+            functools.partial(self.session.sign_in, email, password),
+            functools.partial(self._finish_sign_in, email, password, interactive),
+        )
+
+    def _finish_sign_in(
+        self,
+        email: str,
+        password: str,
+        interactive: bool,
+        future: concurrent.futures.Future[str],
+    ) -> None:
         try:
-            user_id = self.session.sign_in(email, password)
+            user_id = future.result()
             self._save_credentials(email, password)
             self._update_auth_indicator()
             self.user_id_var.set(f"User ID: {user_id}")
@@ -1943,103 +3144,115 @@ class NagDesktopApp:
 
     def sign_out(self) -> None:
         self.session.sign_out()
+        forget_payload_nag_cache()
+        self.pending_changes.clear()
+        self.reload_changes = []
+        self._reload_future = None
+        self.reload_button.state(["!disabled"])
+        self.last_reload = None
         self._clear_saved_credentials()
-        self.events = []
+        self.loaded_row_count = 0
         self.nags_by_work = {}
+        self._nags_changed()
+        self.bucket_counts = None
         self.visible_entries = []
+        self.visible_index_by_key = {}
+        self.visible_due_ms = []
         self.selected_key = None
         self.active_project_name = None
         self.bucket_var.set(ALL_BUCKET)
         self.last_parseable_payload_rows = 0
         self.last_valid_nag_rows = 0
         self.update_bucket_options()
-        self._redraw_canvas()
+        self._request_redraw()
         self._update_auth_indicator()
         self.user_id_var.set("User ID: (not signed in)")
         self.set_status("Signed out.")
 
-    def _parse_payload(self, value: Any) -> Optional[Dict[str, Any]]:
-        if isinstance(value, dict):
-            if "payload" in value and isinstance(value.get("payload"), (dict, str)):
-                nested = self._parse_payload(value.get("payload"))
-                if nested:
-                    return nested
-            return value
-        if isinstance(value, str):
-            text = value.strip()
-            if not text:
-                return None
-            try:
-                parsed = json.loads(text)
-                return parsed if isinstance(parsed, dict) else None
-            except Exception:
-                return None
-        return None
-
-    def _rebuild_current_nags_from_events(self) -> None:
-        current: Dict[str, Nag] = {}
-        parseable_count = 0
-        valid_nag_count = 0
-        sorted_events = sorted(self.events, key=lambda e: str(e.get("created_at", "")))
-        for row in sorted_events:
-            payload = self._parse_payload(row.get("payload"))
-            if not payload:
-                continue
-            parseable_count += 1
-            nag = Nag.from_payload(payload)
-            if not nag:
-                continue
-            row_icon_base64 = normalize_icon_png_base64(row.get("icon_png_base64"))
-            if row_icon_base64:
-                nag.icon_png_base64 = row_icon_base64
-            valid_nag_count += 1
-            action = str(payload.get("action", "")).strip().lower()
-            if action == "delete":
-                current.pop(nag.work_name, None)
-            else:
-                current[nag.work_name] = nag
-        self.last_parseable_payload_rows = parseable_count
-        self.last_valid_nag_rows = valid_nag_count
-        self.nags_by_work = current
-
-    def reload_from_supabase(self, interactive: bool = True, source_label: str = "manual reload") -> None:
+    def reload_from_supabase(
+        self,
+        interactive: bool = True,
+        source_label: str = "manual reload",
+        incremental: bool = False,
+    ) -> None:
         if not self.session.signed_in:
             if interactive:
                 messagebox.showinfo("Sign in required", "Sign in first.", parent=self.root)
             return
+        if self._reload_future is not None and not self._reload_future.done():
+            return
+        self.set_status(f"{source_label}: loading...")
+        # Incremental reloads replay only newer rows over the last server state; confirmed local edits
+        # are among those rows. Sign-in and manual reloads always rebuild from the full history.
+        base = self.last_reload if incremental else None
+        future = _EXECUTOR.submit(fetch_and_rebuild_nags, self.session, base)
+        self._reload_future = future
+        self.reload_changes = [*self.inflight_changes, *self.pending_changes.values()]
+        self.reload_button.state(["disabled"])
+        self.root.after(RELOAD_POLL_INTERVAL_MS, self._poll_reload, future, interactive, source_label)
+
+    def _poll_reload(
+        self,
+        future: concurrent.futures.Future[ReloadResult],
+        interactive: bool,
+        source_label: str,
+    ) -> None:
+        if future is not self._reload_future:
+            # Superseded by sign-out; drop the stale result.
+            return
+        if not future.done():
+            self.root.after(RELOAD_POLL_INTERVAL_MS, self._poll_reload, future, interactive, source_label)
+            return
+        self._reload_future = None
+        self.reload_button.state(["!disabled"])
         try:
-            self.events = self.session.fetch_events()
-            self._rebuild_current_nags_from_events()
-            self.selected_key = None
-            self.update_bucket_options()
-            self.refresh_visible_entries()
-            table_counts = ", ".join(
-                f"{table}:{count}"
-                for table, count in self.session.table_row_counts.items()
-            )
-            if not table_counts:
-                table_counts = "no rows"
-            table_errors = ", ".join(
-                f"{table}:{err}"
-                for table, err in self.session.table_fetch_errors.items()
-            )
-            errors_suffix = f"; errors {table_errors}" if table_errors else ""
-            no_rows_suffix = ""
-            if len(self.events) == 0:
-                no_rows_suffix = " No readable rows were returned for this signed-in user."
-            self.set_status(
-                f"{source_label}: loaded {len(self.events)} merged row(s), active nags: {len(self.nags_by_work)} "
-                f"(payload rows {self.last_parseable_payload_rows}, valid nag rows {self.last_valid_nag_rows}; "
-                f"tables {table_counts}; active table: {self.session.table_name}; "
-                f"user {self.session.user_id}{errors_suffix}).{no_rows_suffix}"
-            )
+            self._apply_reload_result(future.result(), source_label)
         except Exception as exc:
             self.set_status(f"Load failed: {exc}")
             if interactive:
                 messagebox.showerror("Supabase load failed", str(exc), parent=self.root)
 
+    def _apply_reload_result(self, result: ReloadResult, source_label: str) -> None:
+        self.last_reload = result
+        self.loaded_row_count = result.row_count
+        # A copy, so local edits never leak into last_reload (the next incremental base).
+        self.nags_by_work = dict(result.nags_by_work)
+        # The fetch may predate edits made while it ran, even ones already synced; keep showing them.
+        for change in self.reload_changes:
+            if change.action == "delete":
+                self.nags_by_work.pop(change.nag.work_name, None)
+            else:
+                self.nags_by_work[change.nag.work_name] = change.nag
+        self.reload_changes = []
+        self._nags_changed()
+        self.bucket_counts = None
+        self.last_parseable_payload_rows = result.parseable_rows
+        self.last_valid_nag_rows = result.valid_nag_rows
+        self.selected_key = None
+        self._schedule_refresh(bucket_options=True)
+        table_counts = ", ".join(
+            f"{table}:{count}"
+            for table, count in self.session.table_row_counts.items()
+        )
+        if not table_counts:
+            table_counts = "no rows"
+        table_errors = ", ".join(
+            f"{table}:{err}"
+            for table, err in self.session.table_fetch_errors.items()
+        )
+        errors_suffix = f"; errors {table_errors}" if table_errors else ""
+        no_rows_suffix = ""
+        if self.loaded_row_count == 0:
+            no_rows_suffix = " No readable rows were returned for this signed-in user."
+        self.set_status(
+            f"{source_label}: loaded {self.loaded_row_count} merged row(s), active nags: {len(self.nags_by_work)} "
+            f"(payload rows {self.last_parseable_payload_rows}, valid nag rows {self.last_valid_nag_rows}; "
+            f"tables {table_counts}; active table: {self.session.table_name}; "
+            f"user {self.session.user_id}{errors_suffix}).{no_rows_suffix}"
+        )
+
     def update_bucket_options(self) -> None:
-        buckets = sorted({nag.bucket for nag in self.nags_by_work.values()}, key=lambda s: s.lower())
+        buckets = sorted(self._bucket_counts(), key=lambda s: s.lower())
         merged = [ALL_BUCKET] + DEFAULT_BUCKETS + [b for b in buckets if b not in DEFAULT_BUCKETS]
         seen: set[str] = set()
         final: List[str] = []
@@ -2048,7 +3261,7 @@ class NagDesktopApp:
                 seen.add(bucket)
                 final.append(bucket)
         self.bucket_options = final
-        if self.bucket_var.get() not in final:
+        if self._cached_bucket not in final:
             self.bucket_var.set(ALL_BUCKET)
         self._render_icon_button_group(
             container=self.bucket_selector_frame,
@@ -2061,35 +3274,34 @@ class NagDesktopApp:
         self._update_project_navigation_ui()
 
     def _on_bucket_selected(self) -> None:
-        selected_bucket = (self.bucket_var.get() or ALL_BUCKET).strip()
+        selected_bucket = (self._cached_bucket or ALL_BUCKET).strip()
         if selected_bucket.lower() != PROJECT_BUCKET.lower():
             self.active_project_name = None
         self.refresh_visible_entries()
 
     def refresh_visible_entries(self) -> None:
+        clear_recurrence_cache()
         now_value = now_ms()
-        selected_bucket = self.bucket_var.get() or ALL_BUCKET
-        monthly_days = MONTHLY_VIEW_1_YEAR_DAYS if self.view_days_var.get() == "1 year" else MONTHLY_VIEW_30_DAYS
+        context = RefreshContext.build(now_value)
+        selected_bucket = self._cached_bucket or ALL_BUCKET
+        monthly_days = MONTHLY_VIEW_1_YEAR_DAYS if self._cached_view_days == "1 year" else MONTHLY_VIEW_30_DAYS
 
         if selected_bucket.lower() != PROJECT_BUCKET.lower():
             self.active_project_name = None
-        nags = list(self.nags_by_work.values())
+        index = self._nag_filter_index()
         project_overview_mode = False
         if selected_bucket == ALL_BUCKET:
-            nags = [n for n in nags if (n.bucket or "").strip().lower() != PROJECT_BUCKET.lower()]
+            nags = index.outside_project_bucket
         else:
             if selected_bucket.lower() == PROJECT_BUCKET.lower():
-                nags = [n for n in nags if (n.bucket or "").strip().lower() == PROJECT_BUCKET.lower()]
                 active_project = normalize_project_name(self.active_project_name)
                 if active_project:
-                    nags = [
-                        n for n in nags
-                        if (effective_project_name(n) or DEFAULT_PROJECT_NAME).lower() == active_project.lower()
-                    ]
+                    nags = index.by_project_key.get(active_project.lower(), [])
                 else:
+                    nags = index.in_project_bucket
                     project_overview_mode = True
             else:
-                nags = [n for n in nags if n.bucket == selected_bucket]
+                nags = index.by_bucket.get(selected_bucket, [])
 
         if project_overview_mode:
             entries = build_project_overview_entries(nags=nags, now_ms_value=now_value)
@@ -2098,24 +3310,45 @@ class NagDesktopApp:
                 nags=nags,
                 now_ms_value=now_value,
                 monthly_view_days=monthly_days,
-                recurring_view_mode=self.recurring_mode_var.get() or RECUR_NEXT_ONLY,
+                recurring_view_mode=self._cached_recurring_mode or RECUR_NEXT_ONLY,
+                context=context,
             )
-        self.visible_entries = sort_entries(entries, self.sort_var.get() or SORT_SMART, now_value)
+        self.visible_entries = sort_entries(entries, self._cached_sort or SORT_SMART, now_value, context)
+        self.visible_index_by_key = {entry.key: row for row, entry in enumerate(self.visible_entries)}
+        self.visible_due_ms = sorted(e.due_window.due_ms for e in self.visible_entries if e.due_window is not None)
         self._update_project_navigation_ui()
-        self._redraw_canvas()
+        self._request_redraw()
+
+    def _nag_filter_index(self) -> NagFilterIndex:
+        if self.nag_filter_index is None:
+            self.nag_filter_index = NagFilterIndex.build(self.nags_by_work)
+        return self.nag_filter_index
+
+    def _nags_changed(self) -> None:
+        # Call after every change to nags_by_work.
+        self.nag_filter_index = None
+
+    def _bucket_counts(self) -> Dict[str, int]:
+        # Rebuilt after a reload or sign-out; single-nag edits patch it via _patch_bucket_counts.
+        if self.bucket_counts is None:
+            self.bucket_counts = {}
+            for nag in self.nags_by_work.values():
+                self.bucket_counts[nag.bucket] = self.bucket_counts.get(nag.bucket, 0) + 1
+        return self.bucket_counts
 
     def _is_project_overview_mode(self) -> bool:
-        selected_bucket = (self.bucket_var.get() or ALL_BUCKET).strip().lower()
+        selected_bucket = (self._cached_bucket or ALL_BUCKET).strip().lower()
         return selected_bucket == PROJECT_BUCKET.lower() and normalize_project_name(self.active_project_name) is None
 
     def _update_project_navigation_ui(self) -> None:
-        selected_bucket = (self.bucket_var.get() or ALL_BUCKET).strip().lower()
+        selected_bucket = (self._cached_bucket or ALL_BUCKET).strip().lower()
         if selected_bucket != PROJECT_BUCKET.lower():
             self.project_mode_var.set("")
-            self.project_nav_frame.grid_remove()
+            if self.project_nav_frame is not None:
+                self.project_nav_frame.grid_remove()
             return
 
-        self.project_nav_frame.grid()
+        self._get_project_nav_frame().grid()
         active_project = normalize_project_name(self.active_project_name)
         if active_project:
             self.project_mode_var.set(f"Project: {active_project}")
@@ -2146,17 +3379,17 @@ class NagDesktopApp:
 
     def _find_entry_by_y(self, y: int) -> Optional[NagListEntry]:
         canvas_y = int(self.canvas.canvasy(y))
-        for y0, y1, entry in self.row_bounds:
-            if y0 <= canvas_y <= y1:
-                return entry
-        return None
+        index = (canvas_y - ROW_TOP_PX) // ROW_HEIGHT_PX
+        if canvas_y < ROW_TOP_PX or index >= self.row_count or canvas_y > row_bottom_px(index):
+            return None
+        return self.visible_entries[index] if index < len(self.visible_entries) else None
 
     def on_canvas_click(self, event: tk.Event) -> None:
         entry = self._find_entry_by_y(event.y)
         if self._try_enter_project_from_entry(entry):
             return
         self.selected_key = entry.key if entry else None
-        self._redraw_canvas()
+        self._update_selection_highlight()
 
     def on_canvas_double_click(self, event: tk.Event) -> None:
         entry = self._find_entry_by_y(event.y)
@@ -2171,20 +3404,17 @@ class NagDesktopApp:
         if entry:
             self.selected_key = entry.key
             can_enter_project = self._is_project_overview_mode() and bool(effective_project_name(entry.nag))
-            self.row_menu.entryconfigure("Enter project", state="normal" if can_enter_project else "disabled")
-            self._redraw_canvas()
+            row_menu = self._get_row_menu()
+            row_menu.entryconfigure("Enter project", state="normal" if can_enter_project else "disabled")
+            self._update_selection_highlight()
             try:
-                self.row_menu.tk_popup(event.x_root, event.y_root)
+                row_menu.tk_popup(event.x_root, event.y_root)
             finally:
-                self.row_menu.grab_release()
+                row_menu.grab_release()
 
     def _selected_entry(self) -> Optional[NagListEntry]:
-        if not self.selected_key:
-            return None
-        for entry in self.visible_entries:
-            if entry.key == self.selected_key:
-                return entry
-        return None
+        index = self.visible_index_by_key.get(self.selected_key) if self.selected_key else None
+        return None if index is None else self.visible_entries[index]
 
     def enter_selected_project(self) -> None:
         entry = self._selected_entry()
@@ -2198,31 +3428,89 @@ class NagDesktopApp:
                 parent=self.root,
             )
 
-    def _insert_event(self, action: str, nag: Nag) -> bool:
+    def _can_write(self) -> bool:
         if self._reject_write_when_view_only():
             return False
         if not self.session.signed_in:
             messagebox.showwarning("Sign in required", "Sign in first.", parent=self.root)
             return False
+        return True
+
+    def _queue_event(self, action: str, nag: Nag) -> None:
+        # The change shows immediately; its insert goes out with the next batch on the worker pool.
+        if not self._can_write():
+            return
+        # Rows of one bulk insert share a server created_at, so their replay order is not the edit
+        # order; only the latest edit per nag is sent, keeping the earliest previous for rollback.
+        change = self.pending_changes.get(nag.work_name)
+        if change is None:
+            change = PendingChange(action, nag, self.nags_by_work.get(nag.work_name))
+            self.pending_changes[nag.work_name] = change
+            if self._reload_future is not None:
+                self.reload_changes.append(change)
+        else:
+            change.action = action
+            change.nag = nag
+        if action == "delete":
+            self._drop_nag(nag)
+        else:
+            self._store_nag(nag)
+        self._send_pending_changes()
+
+    def _send_pending_changes(self) -> None:
+        # One batch in flight at a time; edits made meanwhile wait and go out together next.
+        if self._session_call_pending or not self.pending_changes or not self.session.signed_in:
+            return
+        batch = list(self.pending_changes.values())
+        self.pending_changes.clear()
+        self.inflight_changes = batch
+        self.set_status(f"Syncing {len(batch)} change(s)...")
+        self._run_session_call(
+            functools.partial(self.session.insert_events, [change.nag.to_payload(change.action) for change in batch]),
+            self._finish_pending_changes,
+        )
+
+    def _finish_pending_changes(self, future: concurrent.futures.Future[int]) -> None:
+        batch = self.inflight_changes
+        self.inflight_changes = []
         try:
-            self.session.insert_event(nag.to_payload(action))
-            self.set_status(f"Synced action '{action}' for {nag.work_name}.")
-            return True
+            future.result()
         except Exception as exc:
-            self.set_status(f"Sync failed: {exc}")
+            # Queued edits were made on top of the rejected ones, so they are reverted as well.
+            rejected = batch + list(self.pending_changes.values())
+            self.pending_changes.clear()
+            rejected_ids = {id(change) for change in rejected}
+            self.reload_changes = [change for change in self.reload_changes if id(change) not in rejected_ids]
+            for change in reversed(rejected):
+                if change.previous is None:
+                    self._drop_nag(change.nag)
+                else:
+                    self._store_nag(change.previous)
+            self.set_status(f"Sync failed; reverted {len(rejected)} change(s): {exc}")
             messagebox.showerror("Supabase sync failed", str(exc), parent=self.root)
-            return False
+            return
+        if len(batch) == 1:
+            self.set_status(f"Synced action '{batch[0].action}' for {batch[0].nag.work_name}.")
+        else:
+            self.set_status(f"Synced {len(batch)} change(s).")
 
     def sync_all(self) -> None:
-        if self._reject_write_when_view_only():
+        if not self._can_write():
             return
-        if not self.session.signed_in:
-            messagebox.showwarning("Sign in required", "Sign in first.", parent=self.root)
+        if self._session_call_pending:
+            self.set_status("Still syncing the previous change; try again in a moment.")
+            return
+        payloads = [nag.to_payload("manual_sync") for nag in self.nags_by_work.values()]
+        self.set_status(f"Syncing {len(payloads)} nag(s)...")
+        self._run_session_call(functools.partial(self.session.insert_events, payloads), self._finish_sync_all)
+
+    def _finish_sync_all(self, future: concurrent.futures.Future[int]) -> None:
+        try:
+            count = future.result()
+        except Exception as exc:
+            self.set_status(f"Sync failed: {exc}")
+            messagebox.showerror("Supabase sync failed", str(exc), parent=self.root)
             return
-        count = 0
-        for nag in list(self.nags_by_work.values()):
-            if self._insert_event("manual_sync", nag):
-                count += 1
         self.set_status(f"Synced {count} nag(s).")
 
     def add_nag(self) -> None:
@@ -2234,10 +3522,7 @@ class NagDesktopApp:
         if not dialog.result:
             return
         nag = dialog.result
-        if self._insert_event("create", nag):
-            self.nags_by_work[nag.work_name] = nag
-            self.update_bucket_options()
-            self.refresh_visible_entries()
+        self._queue_event("create", nag)
 
     def edit_selected(self) -> None:
         if self._reject_write_when_view_only():
@@ -2258,10 +3543,7 @@ class NagDesktopApp:
             return
 
         updated = dialog.result
-        if self._insert_event("update", updated):
-            self.nags_by_work[updated.work_name] = updated
-            self.update_bucket_options()
-            self.refresh_visible_entries()
+        self._queue_event("update", updated)
 
     def delete_selected(self) -> None:
         if self._reject_write_when_view_only():
@@ -2278,11 +3560,7 @@ class NagDesktopApp:
         if not messagebox.askyesno("Delete nag", f"Delete this nag?\n\n{nag.nag_text}", parent=self.root):
             return
 
-        if self._insert_event("delete", nag):
-            self.nags_by_work.pop(nag.work_name, None)
-            self.selected_key = None
-            self.update_bucket_options()
-            self.refresh_visible_entries()
+        self._queue_event("delete", nag)
 
     def push_selected(self) -> None:
         if self._reject_write_when_view_only():
@@ -2308,14 +3586,14 @@ class NagDesktopApp:
             messagebox.showerror("Invalid", "Could not parse duration.", parent=self.root)
             return
 
-        updated = Nag(**{**nag.__dict__})
-        updated.pushed_offset_ms = max(0, updated.pushed_offset_ms + push_ms)
-        updated.push_count = max(0, updated.push_count + 1)
-        updated.pushed_total_ms = max(0, updated.pushed_total_ms + push_ms)
+        updated = replace(
+            nag,
+            pushed_offset_ms=max(0, nag.pushed_offset_ms + push_ms),
+            push_count=max(0, nag.push_count + 1),
+            pushed_total_ms=max(0, nag.pushed_total_ms + push_ms),
+        )
 
-        if self._insert_event("push_due", updated):
-            self.nags_by_work[updated.work_name] = updated
-            self.refresh_visible_entries()
+        self._queue_event("push_due", updated)
 
     def complete_selected_occurrence(self) -> None:
         if self._reject_write_when_view_only():
@@ -2331,69 +3609,123 @@ class NagDesktopApp:
             return
 
         source_due = entry.due_window.source_due_ms
-        if source_due in nag.skipped_monthly_due_epoch_ms:
+        if nag.is_monthly_due_skipped(source_due):
             messagebox.showinfo("Already completed", "That occurrence is already completed.", parent=self.root)
             return
 
-        updated = Nag(**{**nag.__dict__})
-        updated.skipped_monthly_due_epoch_ms = sorted(set(updated.skipped_monthly_due_epoch_ms + [source_due]))[-200:]
+        # The list is kept sorted and unique (from_payload normalises it), so one insort keeps it so.
+        skipped = list(nag.skipped_monthly_due_epoch_ms)
+        bisect.insort(skipped, source_due)
+        updated = replace(nag, skipped_monthly_due_epoch_ms=skipped[-200:])
 
-        if self._insert_event("complete_occurrence", updated):
-            self.nags_by_work[updated.work_name] = updated
-            self.refresh_visible_entries()
+        self._queue_event("complete_occurrence", updated)
 
-    def _parse_duration_to_ms(self, text: str) -> Optional[int]:
-        clean = text.strip().lower()
-        if not clean:
-            return None
+    def _store_nag(self, nag: Nag) -> None:
+        previous = self.nags_by_work.get(nag.work_name)
+        self.nags_by_work[nag.work_name] = nag
+        self._nags_changed()
+        self._schedule_refresh(self._patch_bucket_counts(previous, nag))
 
-        unit_map = {
-            "ms": 1,
-            "s": 1000,
-            "m": 60 * 1000,
-            "h": 60 * 60 * 1000,
-            "d": 24 * 60 * 60 * 1000,
-            "w": 7 * 24 * 60 * 60 * 1000,
-            "y": 365 * 24 * 60 * 60 * 1000,
-        }
+    def _drop_nag(self, nag: Nag) -> None:
+        previous = self.nags_by_work.pop(nag.work_name, None)
+        self._nags_changed()
+        self.selected_key = None
+        self._schedule_refresh(self._patch_bucket_counts(previous, None))
 
-        for unit in ("ms", "s", "m", "h", "d", "w", "y"):
-            if clean.endswith(unit):
-                number_part = clean[: -len(unit)].strip()
-                try:
-                    amount = float(number_part)
-                except Exception:
-                    return None
-                return int(amount * unit_map[unit])
+    def _schedule_refresh(self, bucket_options: bool = False) -> None:
+        # Rapid mutations share one bucket rebuild and one refresh once Tk is idle.
+        self._bucket_options_stale = self._bucket_options_stale or bucket_options
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        if self._bucket_options_stale:
+            self._bucket_options_stale = False
+            self.update_bucket_options()
+        self.refresh_visible_entries()
 
+    def _patch_bucket_counts(self, previous: Optional[Nag], current: Optional[Nag]) -> bool:
+        # Single-nag edits adjust the counts in place; True when a bucket appeared or emptied.
+        # An unbuilt map would be built from the already-changed nags, so leave it to the rebuild.
+        if self.bucket_counts is None:
+            return True
+        counts = self.bucket_counts
+        if previous is not None and current is not None and previous.bucket == current.bucket:
+            return False
+        changed = False
+        if previous is not None:
+            counts[previous.bucket] -= 1
+            if not counts[previous.bucket]:
+                del counts[previous.bucket]
+                changed = True
+        if current is not None:
+            changed = changed or current.bucket not in counts
+            counts[current.bucket] = counts.get(current.bucket, 0) + 1
+        return changed
+
+    def _parse_duration_to_ms(self, text: str) -> Optional[int]:
+        match = DURATION_RE.fullmatch(text.strip().lower())
+        if not match:
+            return None
         try:
-            days = float(clean)
-            return int(days * unit_map["d"])
-        except Exception:
+            return int(float(match.group(1)) * DURATION_UNIT_MS[match.group(2) or "d"])
+        except OverflowError:
             return None
 
+    def _request_redraw(self) -> None:
+        # Bursts (resize, filter clicks, selection) collapse into one paint once Tk is idle.
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        self._redraw_pending = False
+        self._redraw_canvas()
+
     def _redraw_canvas(self, preserve_scroll: bool = True) -> None:
-        previous_view = self.canvas.yview() if preserve_scroll else (0.0, 1.0)
-        previous_start = previous_view[0] if previous_view else 0.0
-        self.canvas.delete("all")
         width = max(900, self.canvas.winfo_width())
-        row_height = 64
-        x0 = 8
-        x1 = width - 12
-        selected_bucket = self.bucket_var.get() or ALL_BUCKET
+        row_height = ROW_HEIGHT_PX
+        selected_bucket = self._cached_bucket or ALL_BUCKET
         project_overview_mode = self._is_project_overview_mode()
-        project_counts: Dict[str, int] = {}
-        if project_overview_mode:
-            for candidate in self.nags_by_work.values():
-                project_name = effective_project_name(candidate)
-                if not project_name:
-                    continue
-                project_counts[project_name] = project_counts.get(project_name, 0) + 1
+        project_counts = self._nag_filter_index().project_counts if project_overview_mode else {}
+        context = RefreshContext.build(now_ms())
+
+        # Timer ticks and stray events often change nothing on screen; skip the repaint then.
+        # Selection is not part of it (the outline moves on its own).
+        signature = (
+            width,
+            selected_bucket,
+            project_overview_mode,
+            project_counts,
+            [(e.key, e.nag, e.due_window) for e in self.visible_entries],
+        )
+        if preserve_scroll and signature == self._last_redraw_signature:
+            self._repaint_stale_rows(context)
+            self._draw_rows_in_view()
+            return
+        self._last_redraw_signature = signature
 
-        self.row_bounds = []
-        now_value = now_ms()
+        previous_view = self.canvas.yview() if preserve_scroll else (0.0, 1.0)
+        previous_start = previous_view[0] if previous_view else 0.0
+        # Row items are kept for reuse (keyed by the row they showed); the selection outline
+        # persists and is repositioned below.
+        self.canvas.delete(CANVAS_EMPTY_TAG)
+        if self.canvas_frame is not None:
+            self.spare_row_items.update(self.canvas_frame.row_items)
+
+        self.row_images_in_use = {}
+        self.canvas_frame = None
+        row_text_cache = self.row_text_cache
+        self.row_text_cache = {e.key: row_text_cache[e.key] for e in self.visible_entries if e.key in row_text_cache}
+        visual_cache = self.visual_cache
+        self.visual_cache = {e.key: visual_cache[e.key] for e in self.visible_entries if e.key in visual_cache}
 
         if not self.visible_entries:
+            self.row_count = 0
             empty_message = "No nags to show."
             if selected_bucket.lower() == PROJECT_BUCKET.lower() and project_overview_mode:
                 empty_message = "No projects in Project bucket yet."
@@ -2404,165 +3736,305 @@ class NagDesktopApp:
                 text=empty_message,
                 fill="#444444",
                 font=("TkDefaultFont", 11),
+                tags=CANVAS_EMPTY_TAG,
             )
+            self._discard_spare_row_items()
             self.canvas.configure(scrollregion=(0, 0, width, 120))
+            self.canvas_content_height = 120.0
+            self._drag_max_offset = None
             if preserve_scroll:
                 self.canvas.yview_moveto(max(0.0, min(1.0, previous_start)))
+            self._place_selection_highlight()
             return
 
-        for index, entry in enumerate(self.visible_entries):
-            y0 = 6 + index * row_height
-            y1 = y0 + row_height - 8
-            nag = entry.nag
-            if project_overview_mode:
-                visual = NagLineVisual(
-                    base_color=(255, 255, 255),
-                    progress_color=(230, 230, 230),
-                    progress_fraction=0.0,
-                    text_color="#000000",
-                    time_label="",
-                    percent_label="",
-                )
-            else:
-                visual = nag_line_visual(nag, now_value, entry.due_window)
-
-            self.canvas.create_rectangle(
-                x0,
-                y0,
-                x1,
-                y1,
-                fill=rgb_to_hex(visual.base_color),
-                outline="#d0d0d0",
-                width=1,
-            )
+        # Rows are a fixed height, so geometry is arithmetic on the index and layout is O(1);
+        # items are only created for rows near the viewport and filled in as the view scrolls.
+        row_count = self.row_count = len(self.visible_entries)
+        self.canvas_frame = CanvasFrame(
+            width=width,
+            selected_bucket=selected_bucket,
+            project_overview_mode=project_overview_mode,
+            project_counts=project_counts,
+            context=context,
+            text_width=(width - 20) - 250,
+            visuals=None if project_overview_mode else {},
+        )
 
-            progress_x = x0 + int((x1 - x0) * max(0.0, min(1.0, visual.progress_fraction)))
-            if progress_x > x0:
-                self.canvas.create_rectangle(
-                    x0,
-                    y0,
-                    progress_x,
-                    y1,
-                    fill=rgb_to_hex(visual.progress_color),
-                    outline="",
-                )
+        total_height = 12 + row_count * row_height
+        self.canvas.configure(scrollregion=(0, 0, width, total_height))
+        self.canvas_content_height = float(total_height)
+        self._drag_max_offset = None
+        if preserve_scroll:
+            self.canvas.yview_moveto(max(0.0, min(1.0, previous_start)))
+        self._draw_rows_in_view()
+        self._discard_spare_row_items()
+        self._place_selection_highlight()
+
+    def _repaint_stale_rows(self, context: RefreshContext) -> None:
+        # Only painted rows are checked; the rest are resolved against the new time when drawn.
+        frame = self.canvas_frame
+        if frame is None or frame.visuals is None:
+            return
+        entries = self.visible_entries
+        previous = frame.visuals
+        frame.context = context
+        frame.visuals = {
+            index: cached_line_visual(entries[index], context, self.visual_cache) for index in frame.row_items
+        }
+        for index, visual in frame.visuals.items():
+            if previous.get(index) != visual:
+                # Hand the row its own items back; _draw_row then rewrites only what changed.
+                self.spare_row_items[index] = frame.row_items.pop(index)
+                self._draw_row(frame, index)
+
+    def _discard_spare_row_items(self) -> None:
+        # Items not reused by this frame's visible rows; one delete call clears them all.
+        if self.spare_row_items:
+            ids: List[int] = []
+            for items in self.spare_row_items.values():
+                ids.extend((items.background, items.progress, items.icon, items.title, items.subtitle, items.right))
+            self.canvas.delete(*ids)
+            self.spare_row_items.clear()
+
+    def _update_selection_highlight(self) -> None:
+        # A pending redraw places the highlight itself; otherwise just move the one outline item.
+        if not self._redraw_pending:
+            self._place_selection_highlight()
+
+    def _place_selection_highlight(self) -> None:
+        frame = self.canvas_frame
+        index = self.visible_index_by_key.get(self.selected_key) if frame is not None and self.selected_key else None
+        if index is None:
+            if self._selection_rect_item is not None:
+                self.canvas.delete(self._selection_rect_item)
+                self._selection_rect_item = None
+            return
+        coords = (8, row_top_px(index), frame.width - 12, row_bottom_px(index))
+        if self._selection_rect_item is None:
+            self._selection_rect_item = self.canvas.create_rectangle(*coords, outline="#1565c0", width=2)
+        else:
+            self.canvas.coords(self._selection_rect_item, *coords)
+            self.canvas.tag_raise(self._selection_rect_item)
 
-            if self.selected_key == entry.key:
-                self.canvas.create_rectangle(x0, y0, x1, y1, outline="#1565c0", width=2)
-
-            left_text_x = x0 + 10
-            image = self._resolve_row_image(nag)
-            if image is not None:
-                self.canvas.create_image(x0 + 10, y0 + int((row_height - 8) / 2), image=image, anchor="w")
-                left_text_x = x0 + 54
-            icon = (normalize_icon_glyph(nag.icon_glyph) or "")[:3]
-            if image is not None:
-                icon = ""
-            project_name = effective_project_name(nag)
-            if project_overview_mode:
-                title_prefix = f"[{project_name or DEFAULT_PROJECT_NAME}] "
-            elif selected_bucket == ALL_BUCKET:
-                if project_name:
-                    title_prefix = f"[{nag.bucket}:{project_name}] "
-                else:
-                    title_prefix = f"[{nag.bucket}] "
-            else:
-                title_prefix = ""
-            title = f"{icon + ' ' if icon else ''}{title_prefix}{nag.nag_text}"
-            if project_overview_mode:
-                project_task_count = project_counts.get(project_name or DEFAULT_PROJECT_NAME, 0)
-                subtitle = f"{project_task_count} task(s) in project"
-            else:
-                subtitle_parts: List[str] = [f"w{nag.weight}", f"late:{nag.lateness_days}d"]
-                if nag.mode == NAG_MODE_MONTHLY and nag.recurring_visible_days_before_due is not None:
-                    subtitle_parts.append(f"vis<= {max(1, nag.recurring_visible_days_before_due)}d")
-                recurring_badge = recurring_indicator_label(nag)
-                if recurring_badge:
-                    subtitle_parts.append(recurring_badge)
-                push_badge = push_summary_label(nag)
-                if push_badge:
-                    subtitle_parts.append(push_badge)
-                subtitle = "  ".join(subtitle_parts)
+    def _on_canvas_yview(self, first: str, last: str) -> None:
+        # Tk reports every view change here (wheel, drag, resize), so newly exposed rows get drawn.
+        self._draw_rows_in_view()
 
-            self.canvas.create_text(
-                left_text_x,
-                y0 + 18,
-                anchor="w",
-                text=title,
-                fill=visual.text_color,
-                width=(x1 - x0) - 250,
-                font=("TkDefaultFont", 10, "bold"),
+    def _draw_rows_in_view(self) -> None:
+        frame = self.canvas_frame
+        row_count = self.row_count
+        if frame is None or not row_count:
+            return
+        total_height = 12 + row_count * ROW_HEIGHT_PX
+        view_top, view_bottom = self.canvas.yview()
+        top_px = view_top * total_height - ROW_OVERSCAN_PX
+        bottom_px = view_bottom * total_height + ROW_OVERSCAN_PX
+        # First row whose bottom is below top_px, and one past the last row starting above bottom_px.
+        first = max(0, min(row_count, int((top_px - row_bottom_px(0)) // ROW_HEIGHT_PX) + 1))
+        last = max(0, min(row_count, int((bottom_px - ROW_TOP_PX) // ROW_HEIGHT_PX) + 1))
+        drew = False
+        for index in range(first, last):
+            if index not in frame.row_items:
+                self._draw_row(frame, index)
+                drew = True
+        if drew and self._selection_rect_item is not None:
+            # Keep the shared outline above row fills painted after it.
+            self.canvas.tag_raise(self._selection_rect_item)
+
+    def _row_text(self, frame: CanvasFrame, entry: NagListEntry, has_image: bool) -> Tuple[str, str]:
+        nag = entry.nag
+        # Edits swap in a new Nag object, so identity plus the view inputs decide a hit.
+        # Overview subtitles depend on project counts and are always rebuilt.
+        signature = (frame.selected_bucket, has_image)
+        cached = None if frame.project_overview_mode else self.row_text_cache.get(entry.key)
+        if cached is not None and cached[0] is nag and cached[1] == signature:
+            return cached[2], cached[3]
+
+        icon = "" if has_image else (normalize_icon_glyph(nag.icon_glyph) or "")[:3]
+        project_name = effective_project_name(nag)
+        if frame.project_overview_mode:
+            project_label = project_name or DEFAULT_PROJECT_NAME
+            project_task_count = frame.project_counts.get(project_label, 0)
+            title = f"{icon + ' ' if icon else ''}[{project_label}] {nag.nag_text}"
+            return title, f"{project_task_count} task(s) in project"
+        if frame.selected_bucket == ALL_BUCKET:
+            if project_name:
+                title_prefix = f"[{nag.bucket}:{project_name}] "
+            else:
+                title_prefix = f"[{nag.bucket}] "
+        else:
+            title_prefix = ""
+        title = f"{icon + ' ' if icon else ''}{title_prefix}{nag.nag_text}"
+        subtitle_parts: List[str] = [f"w{nag.weight}", f"late:{nag.lateness_days}d"]
+        if nag.mode == NAG_MODE_MONTHLY and nag.recurring_visible_days_before_due is not None:
+            subtitle_parts.append(f"vis<= {max(1, nag.recurring_visible_days_before_due)}d")
+        recurring_badge = recurring_indicator_label(nag)
+        if recurring_badge:
+            subtitle_parts.append(recurring_badge)
+        push_badge = push_summary_label(nag)
+        if push_badge:
+            subtitle_parts.append(push_badge)
+        subtitle = "  ".join(subtitle_parts)
+        self.row_text_cache[entry.key] = (nag, signature, title, subtitle)
+        return title, subtitle
+
+    def _draw_row(self, frame: CanvasFrame, index: int) -> None:
+        entry = self.visible_entries[index]
+        row_height = ROW_HEIGHT_PX
+        x0 = 8
+        x1 = frame.width - 12
+        y0 = row_top_px(index)
+        y1 = row_bottom_px(index)
+        project_overview_mode = frame.project_overview_mode
+        nag = entry.nag
+        if frame.visuals is None:
+            visual = NagLineVisual(
+                base_color=(255, 255, 255),
+                progress_color=(230, 230, 230),
+                progress_fraction=0.0,
+                text_color="#000000",
+                time_label="",
+                percent_label="",
             )
-
-            self.canvas.create_text(
-                left_text_x,
-                y0 + 39,
-                anchor="w",
-                text=subtitle,
-                fill=visual.text_color,
-                width=(x1 - x0) - 250,
-                font=("TkDefaultFont", 8),
+        else:
+            # Resolved on first paint so rows never scrolled into view cost nothing.
+            visual = frame.visuals.get(index)
+            if visual is None:
+                visual = frame.visuals[index] = cached_line_visual(entry, frame.context, self.visual_cache)
+
+        progress_x = x0 + int((x1 - x0) * max(0.0, min(1.0, visual.progress_fraction)))
+        image = self._resolve_row_image(nag)
+        if image is not None:
+            self.row_images_in_use[index] = image
+        else:
+            self.row_images_in_use.pop(index, None)
+        left_text_x = x0 + 54 if image is not None else x0 + 10
+        title, subtitle = self._row_text(frame, entry, image is not None)
+        right_label = ""
+        if not project_overview_mode:
+            right_label = visual.time_label
+            if visual.percent_label:
+                right_label = f"{right_label} /{visual.percent_label}".strip()
+
+        # Prefer the items that showed this same row last frame; often nothing changed at all.
+        spare = self.spare_row_items
+        if index in spare:
+            items = spare.pop(index)
+        elif spare:
+            items = spare.pop(next(iter(spare)))
+        else:
+            items = self._create_row_items()
+        frame.row_items[index] = items
+        shown = (y0, x1, visual, image, title, subtitle, project_overview_mode, right_label)
+        if items.shown == shown:
+            return
+        items.shown = shown
+
+        # Straight Tcl calls: Canvas.coords() parses back the coordinate list and itemconfigure()
+        # merges option dicts, neither of which a write needs.
+        call = self.canvas.tk.call
+        path = self.canvas_path
+        call(path, "coords", items.background, x0, y0, x1, y1)
+        call(path, "itemconfigure", items.background, "-fill", rgb_to_hex(visual.base_color))
+        if progress_x > x0:
+            call(path, "coords", items.progress, x0, y0, progress_x, y1)
+            call(
+                path, "itemconfigure", items.progress, "-fill", rgb_to_hex(visual.progress_color), "-state", "normal"
             )
-
-            if not project_overview_mode:
-                right_label = visual.time_label
-                if visual.percent_label:
-                    right_label = f"{right_label} /{visual.percent_label}".strip()
-                self.canvas.create_text(
-                    x1 - 8,
-                    y0 + (row_height / 2) - 6,
-                    anchor="e",
-                    text=right_label,
-                    fill=visual.text_color,
-                    font=("TkDefaultFont", 9),
-                )
-
-            self.row_bounds.append((y0, y1, entry))
-
-        total_height = 12 + len(self.visible_entries) * row_height
-        self.canvas.configure(scrollregion=(0, 0, width, total_height))
-        if preserve_scroll:
-            self.canvas.yview_moveto(max(0.0, min(1.0, previous_start)))
+        else:
+            call(path, "itemconfigure", items.progress, "-state", "hidden")
+        if image is not None:
+            call(path, "coords", items.icon, x0 + 10, y0 + (row_height - 8) // 2)
+            call(path, "itemconfigure", items.icon, "-image", image, "-state", "normal")
+        else:
+            call(path, "itemconfigure", items.icon, "-image", "", "-state", "hidden")
+        text_color = visual.text_color
+        text_width = frame.text_width
+        call(path, "coords", items.title, left_text_x, y0 + 18)
+        call(path, "itemconfigure", items.title, "-text", title, "-fill", text_color, "-width", text_width)
+        call(path, "coords", items.subtitle, left_text_x, y0 + 39)
+        call(path, "itemconfigure", items.subtitle, "-text", subtitle, "-fill", text_color, "-width", text_width)
+        if project_overview_mode:
+            call(path, "itemconfigure", items.right, "-state", "hidden")
+        else:
+            call(path, "coords", items.right, x1 - 8, y0 + (row_height / 2) - 6)
+            call(path, "itemconfigure", items.right, "-text", right_label, "-fill", text_color, "-state", "normal")
+
+    def _create_row_items(self) -> CanvasRowItems:
+        # Created in paint order (fill, progress, icon, text) so reuse keeps the stacking right.
+        canvas = self.canvas
+        return CanvasRowItems(
+            background=canvas.create_rectangle(0, 0, 0, 0, outline="#d0d0d0", width=1, tags=CANVAS_ROW_TAG),
+            progress=canvas.create_rectangle(0, 0, 0, 0, outline="", tags=CANVAS_ROW_TAG),
+            icon=canvas.create_image(0, 0, anchor="w", tags=CANVAS_ROW_TAG),
+            title=canvas.create_text(0, 0, anchor="w", font=ROW_TITLE_FONT, tags=CANVAS_ROW_TAG),
+            subtitle=canvas.create_text(0, 0, anchor="w", font=ROW_SUBTITLE_FONT, tags=CANVAS_ROW_TAG),
+            right=canvas.create_text(0, 0, anchor="e", font=ROW_RIGHT_FONT, tags=CANVAS_ROW_TAG),
+        )
 
     def _resolve_row_image(self, nag: Nag) -> Optional[ImageTk.PhotoImage]:
-        inline_icon_base64 = normalize_icon_png_base64(nag.icon_png_base64)
-        if inline_icon_base64:
-            inline_key = f"inline:{hashlib.sha1(inline_icon_base64.encode('utf-8')).hexdigest()}"
+        inline_icon_base64, inline_key = inline_icon(nag)
+        if inline_icon_base64 and inline_key:
             if inline_key not in self.row_image_failures:
-                cached_inline = self.row_image_cache.get(inline_key)
+                cached_inline = self._get_row_image(inline_key)
                 if cached_inline is not None:
                     return cached_inline
                 try:
-                    image = Image.open(BytesIO(base64.b64decode(inline_icon_base64, validate=True)))
-                    image = image.convert("RGBA")
-                    image.thumbnail((36, 36), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
-                    self.row_image_cache[inline_key] = photo
+                    photo = ImageTk.PhotoImage(decode_icon_thumbnail(inline_icon_base64))
+                    self._put_row_image(inline_key, photo)
                     return photo
                 except Exception:
-                    self.row_image_failures.add(inline_key)
+                    self._add_row_image_failure(inline_key)
 
         url = normalize_image_url(nag.image_url)
         if not url or url in self.row_image_failures:
             return None
-        cached = self.row_image_cache.get(url)
+        cached = self._get_row_image(url)
         if cached is not None:
             return cached
 
-        try:
-            response = requests.get(url, timeout=12)
-            if response.status_code >= 300:
-                self.row_image_failures.add(url)
-                return None
-            image = Image.open(BytesIO(response.content))
-            image = image.convert("RGBA")
-            image.thumbnail((36, 36), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(image)
-            self.row_image_cache[url] = photo
-            return photo
-        except Exception:
-            self.row_image_failures.add(url)
-            return None
+        # Draw without the image for now; the row is repainted once the download lands.
+        if url not in self.row_image_inflight:
+            self.row_image_inflight[url] = _IMAGE_EXECUTOR.submit(fetch_image_thumbnail, url)
+            if self._row_image_poll_job is None:
+                self._row_image_poll_job = self.root.after(RELOAD_POLL_INTERVAL_MS, self._poll_row_images)
+        return None
+
+    def _poll_row_images(self) -> None:
+        self._row_image_poll_job = None
+        installed = False
+        for url, future in list(self.row_image_inflight.items()):
+            if not future.done():
+                continue
+            del self.row_image_inflight[url]
+            try:
+                self._put_row_image(url, ImageTk.PhotoImage(future.result()))
+                installed = True
+            except Exception:
+                self._add_row_image_failure(url)
+        if installed:
+            # Rows waiting on these images must repaint even though nothing else changed.
+            self._last_redraw_signature = None
+            self._request_redraw()
+        if self.row_image_inflight:
+            self._row_image_poll_job = self.root.after(RELOAD_POLL_INTERVAL_MS, self._poll_row_images)
+
+    def _get_row_image(self, key: str) -> Optional[ImageTk.PhotoImage]:
+        photo = self.row_image_cache.get(key)
+        if photo is not None:
+            self.row_image_cache.move_to_end(key)
+        return photo
+
+    def _put_row_image(self, key: str, photo: ImageTk.PhotoImage) -> None:
+        self.row_image_cache[key] = photo
+        self.row_image_cache.move_to_end(key)
+        while len(self.row_image_cache) > ROW_IMAGE_CACHE_SIZE:
+            self.row_image_cache.popitem(last=False)
+
+    def _add_row_image_failure(self, key: str) -> None:
+        self.row_image_failures[key] = None
+        while len(self.row_image_failures) > ROW_IMAGE_FAILURE_LIMIT:
+            self.row_image_failures.popitem(last=False)
 
 
 def main() -> None: